@@ -5,11 +5,7 @@ import io
 from typing import Callable, Iterable, Sequence
 
 from lawdocx.io_utils import InputSource
-from lawdocx.utils import (
-    build_envelope,
-    filter_files_by_severity,
-    summarize_severities,
-)
+from lawdocx.utils import build_envelope, filter_and_summarize
 
 ToolRunner = Callable[[Iterable[InputSource]], dict]
 
@@ -54,11 +50,10 @@ def run_audit(
     for _, runner in tool_runners:
         cloned_inputs = _clone_inputs(buffered_inputs)
         envelope = runner(cloned_inputs)
-        filtered_files = filter_files_by_severity(envelope.get("files", []), severity)
+        filtered_files, tool_summary = filter_and_summarize(envelope.get("files", []), severity)
         envelope = {**envelope, "files": filtered_files}
         aggregated_tools.append(envelope)
 
-        tool_summary = summarize_severities(filtered_files)
         for key, value in tool_summary.items():
             totals[key] += value
 
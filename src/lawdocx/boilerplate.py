@@ -3,14 +3,13 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
-from typing import Iterable, List
-from uuid import uuid4
+from typing import IO, Iterable, List
 
 from docx2python import docx2python
 
-from lawdocx.io_utils import InputSource
+from lawdocx.io_utils import InputSource, iter_collector_targets
 from lawdocx.models import Finding
-from lawdocx.utils import build_envelope, hash_bytes, utc_timestamp
+from lawdocx.utils import build_envelope, new_finding_id, utc_timestamp
 
 DEFAULT_BOILERPLATE = [
     # 1–12: Draft / watermark legends (case-insensitive)
@@ -79,7 +78,7 @@ def _context(text: str, start: int, end: int) -> dict:
 
 def _error_finding(message: str) -> Finding:
     return Finding(
-        id=uuid4().hex[:8],
+        id=new_finding_id(),
         type="boilerplate",
         severity="error",
         location=_base_location("header", 0, 0, "unknown"),
@@ -91,20 +90,20 @@ def _flatten(paragraphs: list) -> list[str]:
     """Flatten docx2python's nested paragraph representation into strings."""
 
     flat: list[str] = []
+    stack = [paragraphs]
 
-    def _walk(node):
+    while stack:
+        node = stack.pop()
         if isinstance(node, str):
             flat.append(node)
         elif isinstance(node, list):
-            for child in node:
-                _walk(child)
+            stack.extend(reversed(node))
 
-    _walk(paragraphs)
     return flat
 
 
 def collect_boilerplate(
-    file_path: str,
+    file_path: str | IO[bytes],
     file_index: int = 0,
     *,
     patterns: Iterable[str] | None = None,
@@ -159,7 +158,7 @@ def collect_boilerplate(
                             for match in pattern.finditer(paragraph):
                                 findings.append(
                                     Finding(
-                                        id=uuid4().hex[:8],
+                                        id=new_finding_id(),
                                         type="boilerplate",
                                         severity="warning",
                                         location=_base_location(
@@ -186,22 +185,8 @@ def run_boilerplate(inputs: Iterable[InputSource]) -> dict:
     generated_at = utc_timestamp()
     merged_files: List[dict] = []
 
-    for file_index, source in enumerate(inputs):
-        data = source.handle.read()
-        sha256 = hash_bytes(data)
-
-        temp_path: str | None = None
-        if source.is_stdin:
-            from tempfile import NamedTemporaryFile
-
-            with NamedTemporaryFile(delete=False, suffix=".docx") as temp:
-                temp.write(data)
-                temp_path = temp.name
-            target_path = temp_path
-        else:
-            target_path = source.path
-
-        findings = collect_boilerplate(target_path, file_index)
+    for file_index, (source, sha256, target) in enumerate(iter_collector_targets(inputs)):
+        findings = collect_boilerplate(target, file_index)
 
         file_entry = {
             "path": source.display_name,
@@ -209,9 +194,6 @@ def run_boilerplate(inputs: Iterable[InputSource]) -> dict:
             "items": [f.as_dict() for f in findings],
         }
 
-        if temp_path:
-            Path(temp_path).unlink(missing_ok=True)
-
         merged_files.append(file_entry)
 
     return build_envelope(
@@ -4,17 +4,19 @@ from __future__ import annotations
 import bisect
 import re
 import zipfile
-from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Iterable, List
-from uuid import uuid4
+from typing import IO, Iterable, List
 
 from docx2python import docx2python
 from lxml import etree
 
-from lawdocx.io_utils import InputSource
+from lawdocx.io_utils import InputSource, iter_collector_targets
 from lawdocx.models import Finding
-from lawdocx.utils import build_envelope, hash_bytes, text_context, utc_timestamp
+from lawdocx.utils import (
+    build_envelope,
+    new_finding_id,
+    text_context,
+    utc_timestamp,
+)
 
 WORD_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
 NS = {"w": WORD_NAMESPACE}
@@ -30,7 +32,7 @@ def _base_location(story: str, start: int, end: int) -> dict:
 
 def _error_finding(file_index: int, message: str) -> Finding:
     return Finding(
-        id=uuid4().hex[:8],
+        id=new_finding_id(),
         type="bracket",
         severity="error",
         location=_base_location("body", 0, 0),
@@ -41,15 +43,15 @@ def _error_finding(file_index: int, message: str) -> Finding:
 
 def _flatten(paragraphs: list) -> list[str]:
     flat: list[str] = []
+    stack = [paragraphs]
 
-    def _walk(node):
+    while stack:
+        node = stack.pop()
         if isinstance(node, str):
             flat.append(node)
         elif isinstance(node, list):
-            for child in node:
-                _walk(child)
+            stack.extend(reversed(node))
 
-    _walk(paragraphs)
     return flat
 
 
@@ -159,7 +161,7 @@ def _scan_story(
         para_end = _paragraph_index(max(start, end - 1), starts, paragraph_count)
         findings.append(
             Finding(
-                id=uuid4().hex[:8],
+                id=new_finding_id(),
                 type="bracket",
                 severity="warning",
                 location=_base_location(story, para_start, para_end),
@@ -172,7 +174,7 @@ def _scan_story(
 
 
 def collect_brackets(
-    file_path: str, file_index: int = 0, *, patterns: Iterable[str] | None = None
+    file_path: str | IO[bytes], file_index: int = 0, *, patterns: Iterable[str] | None = None
 ) -> list[Finding]:
     findings: list[Finding] = []
     compiled = _compile_patterns(patterns) if patterns else None
@@ -218,20 +220,8 @@ def run_brackets(inputs: Iterable[InputSource], *, patterns: Iterable[str] | Non
     generated_at = utc_timestamp()
     merged_files: List[dict] = []
 
-    for file_index, source in enumerate(inputs):
-        data = source.handle.read()
-        sha256 = hash_bytes(data)
-
-        temp_path: str | None = None
-        if source.is_stdin:
-            with NamedTemporaryFile(delete=False, suffix=".docx") as temp:
-                temp.write(data)
-                temp_path = temp.name
-            target_path = temp_path
-        else:
-            target_path = source.path
-
-        findings = collect_brackets(target_path, file_index, patterns=patterns)
+    for file_index, (source, sha256, target) in enumerate(iter_collector_targets(inputs)):
+        findings = collect_brackets(target, file_index, patterns=patterns)
 
         file_entry = {
             "path": source.display_name,
@@ -239,9 +229,6 @@ def run_brackets(inputs: Iterable[InputSource], *, patterns: Iterable[str] | Non
             "items": [f.as_dict() for f in findings],
         }
 
-        if temp_path:
-            Path(temp_path).unlink(missing_ok=True)
-
         merged_files.append(file_entry)
 
     return build_envelope(
@@ -2,18 +2,15 @@
 from __future__ import annotations
 
 import zipfile
-from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Iterable, List
-from uuid import uuid4
+from typing import IO, Iterable, List
 
 from lxml import etree
 
-from lawdocx.io_utils import InputSource
+from lawdocx.io_utils import InputSource, iter_collector_targets
 from lawdocx.models import Finding
 from lawdocx.utils import (
     build_envelope,
-    hash_bytes,
+    new_finding_id,
     text_context,
     utc_timestamp,
 )
@@ -39,7 +36,7 @@ def _base_location(story: str, paragraph_index: int) -> dict:
 
 def _error_finding(message: str) -> Finding:
     return Finding(
-        id=uuid4().hex[:8],
+        id=new_finding_id(),
         type="insertion",
         severity="error",
         location=_base_location("body", 0),
@@ -123,7 +120,7 @@ def _collect_story_changes(
         for change in change_records:
             findings.append(
                     Finding(
-                        id=uuid4().hex[:8],
+                        id=new_finding_id(),
                         type=change["type"],
                         severity="warning",
                         location=_base_location(story, para_index),
@@ -156,7 +153,7 @@ def _collect_notes_changes(
             for change in change_records:
                 findings.append(
                     Finding(
-                        id=uuid4().hex[:8],
+                        id=new_finding_id(),
                         type=change["type"],
                         severity="warning",
                         location=_base_location(story, paragraph_index),
@@ -167,7 +164,7 @@ def _collect_notes_changes(
             paragraph_index += 1
 
 
-def collect_changes(file_path: str) -> list[Finding]:
+def collect_changes(file_path: str | IO[bytes]) -> list[Finding]:
     findings: list[Finding] = []
 
     try:
@@ -214,20 +211,8 @@ def run_changes(inputs: Iterable[InputSource]) -> dict:
     generated_at = utc_timestamp()
     merged_files: List[dict] = []
 
-    for source in inputs:
-        data = source.handle.read()
-        sha256 = hash_bytes(data)
-
-        temp_path: str | None = None
-        if source.is_stdin:
-            with NamedTemporaryFile(delete=False, suffix=".docx") as temp:
-                temp.write(data)
-                temp_path = temp.name
-            target_path = temp_path
-        else:
-            target_path = source.path
-
-        findings = collect_changes(target_path)
+    for source, sha256, target in iter_collector_targets(inputs):
+        findings = collect_changes(target)
 
         file_entry = {
             "path": source.display_name,
@@ -235,9 +220,6 @@ def run_changes(inputs: Iterable[InputSource]) -> dict:
             "items": [f.as_dict() for f in findings],
         }
 
-        if temp_path:
-            Path(temp_path).unlink(missing_ok=True)
-
         merged_files.append(file_entry)
 
     return build_envelope(
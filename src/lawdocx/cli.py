@@ -13,7 +13,7 @@ from lawdocx.highlights import run_highlights
 from lawdocx.metadata import run_metadata
 from lawdocx.outline import run_outline
 from lawdocx.todos import run_todos
-from lawdocx.utils import dump_json_line, filter_files_by_severity, summarize_severities
+from lawdocx.utils import dump_json_line, filter_and_summarize
 
 
 @click.group()
@@ -69,6 +69,17 @@ def _common_options(func):
     return func
 
 
+def _jobs_option(func):
+    return click.option(
+        "--jobs",
+        "-j",
+        type=click.IntRange(min=1),
+        default=1,
+        show_default=True,
+        help="Number of worker processes used to read multiple files.",
+    )(func)
+
+
 def _execute_tool(
     runner,
     paths,
@@ -88,8 +99,9 @@ def _execute_tool(
                 click.echo(f"  - {source.display_name}", err=True)
 
         envelope = runner(inputs, **kwargs)
-        filtered_files = filter_files_by_severity(envelope.get("files", []), severity.lower())
-        summary = summarize_severities(filtered_files)
+        filtered_files, summary = filter_and_summarize(
+            envelope.get("files", []), severity.lower()
+        )
 
         dump_json_line({**envelope, "files": filtered_files}, output_handle)
 
@@ -141,7 +153,8 @@ def _resolve_audit_tools(only: tuple[str, ...], exclude: tuple[str, ...]):
 
 @main.command()
 @_common_options
-def metadata(paths, output, verbose, fail_on_findings, severity):
+@_jobs_option
+def metadata(paths, output, verbose, fail_on_findings, severity, jobs):
     """Extract metadata."""
 
     _execute_tool(
@@ -151,6 +164,7 @@ def metadata(paths, output, verbose, fail_on_findings, severity):
         verbose,
         fail_on_findings,
         severity,
+        workers=jobs,
     )
 
 
@@ -208,7 +222,8 @@ def boilerplate(paths, output, verbose, fail_on_findings, severity):
 
 @main.command()
 @_common_options
-def todos(paths, output, verbose, fail_on_findings, severity):
+@_jobs_option
+def todos(paths, output, verbose, fail_on_findings, severity, jobs):
     """Detect TODO/NTD/placeholder markers."""
 
     _execute_tool(
@@ -218,6 +233,7 @@ def todos(paths, output, verbose, fail_on_findings, severity):
         verbose,
         fail_on_findings,
         severity,
+        workers=jobs,
     )
 
 
@@ -268,7 +284,8 @@ def highlights(paths, output, verbose, fail_on_findings, severity):
 
 @main.command()
 @_common_options
-def outline(paths, output, verbose, fail_on_findings, severity):
+@_jobs_option
+def outline(paths, output, verbose, fail_on_findings, severity, jobs):
     """Detect outline numbering issues."""
 
     _execute_tool(
@@ -278,6 +295,7 @@ def outline(paths, output, verbose, fail_on_findings, severity):
         verbose,
         fail_on_findings,
         severity,
+        workers=jobs,
     )
 
 
@@ -2,16 +2,18 @@
 from __future__ import annotations
 
 import zipfile
-from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Iterable, List
-from uuid import uuid4
+from typing import IO, Iterable, List
 
 from lxml import etree
 
-from lawdocx.io_utils import InputSource
+from lawdocx.io_utils import InputSource, iter_collector_targets
 from lawdocx.models import Finding
-from lawdocx.utils import build_envelope, hash_bytes, text_context, utc_timestamp
+from lawdocx.utils import (
+    build_envelope,
+    new_finding_id,
+    text_context,
+    utc_timestamp,
+)
 
 WORD_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
 W14_NAMESPACE = "http://schemas.microsoft.com/office/word/2010/wordml"
@@ -43,7 +45,7 @@ def _base_location(
 
 def _error_finding(message: str) -> Finding:
     return Finding(
-        id=uuid4().hex[:8],
+        id=new_finding_id(),
         type="comment",
         severity="error",
         location=_base_location(0, 0, None),
@@ -192,7 +194,7 @@ def _parse_comments_extended(zipf: zipfile.ZipFile) -> dict[str, dict]:
     return extended
 
 
-def collect_comments(file_path: str) -> list[Finding]:
+def collect_comments(file_path: str | IO[bytes]) -> list[Finding]:
     findings: list[Finding] = []
 
     try:
@@ -289,7 +291,7 @@ def collect_comments(file_path: str) -> list[Finding]:
 
             findings.append(
                 Finding(
-                    id=uuid4().hex[:8],
+                    id=new_finding_id(),
                     type="comment",
                     severity="info",
                     location=location,
@@ -307,20 +309,8 @@ def run_comments(inputs: Iterable[InputSource]) -> dict:
     generated_at = utc_timestamp()
     merged_files: List[dict] = []
 
-    for source in inputs:
-        data = source.handle.read()
-        sha256 = hash_bytes(data)
-
-        temp_path: str | None = None
-        if source.is_stdin:
-            with NamedTemporaryFile(delete=False, suffix=".docx") as temp:
-                temp.write(data)
-                temp_path = temp.name
-            target_path = temp_path
-        else:
-            target_path = source.path
-
-        findings = collect_comments(target_path)
+    for source, sha256, target in iter_collector_targets(inputs):
+        findings = collect_comments(target)
 
         file_entry = {
             "path": source.display_name,
@@ -328,9 +318,6 @@ def run_comments(inputs: Iterable[InputSource]) -> dict:
             "items": [f.as_dict() for f in findings],
         }
 
-        if temp_path:
-            Path(temp_path).unlink(missing_ok=True)
-
         merged_files.append(file_entry)
 
     return build_envelope(
@@ -0,0 +1,61 @@
+"""Shared read access to the parts of a DOCX package."""
+from __future__ import annotations
+
+import io
+import zipfile
+from typing import IO, Iterable
+
+
+class DocxContext:
+    """Open a DOCX package once and cache the parts read from it.
+
+    Collectors that accept a ``DocxContext`` read their parts through it, so
+    a caller that passes the same context to several of them opens the
+    archive and decompresses each shared part (such as
+    ``word/document.xml``) only once. The ``run_*`` helpers and ``audit``
+    still open each input separately per tool.
+    """
+
+    def __init__(self, source: str | IO[bytes]) -> None:
+        self._zipf = zipfile.ZipFile(source)
+        self._parts: dict[str, bytes] = {}
+
+    def __contains__(self, part: str) -> bool:
+        if part in self._parts:
+            return True
+        try:
+            self._zipf.getinfo(part)
+        except KeyError:
+            return False
+        return True
+
+    def read(self, part: str) -> bytes:
+        """Return the bytes of ``part``, raising ``KeyError`` if it is missing."""
+
+        data = self._parts.get(part)
+        if data is None:
+            data = self._parts[part] = self._zipf.read(part)
+        return data
+
+    def prefetch(self, parts: Iterable[str]) -> None:
+        """Read the listed parts that exist, in archive order, into the cache."""
+
+        wanted = set(parts).difference(self._parts)
+        infos = [info for info in self._zipf.infolist() if info.filename in wanted]
+        for info in sorted(infos, key=lambda info: info.header_offset):
+            self._parts[info.filename] = self._zipf.read(info)
+
+    def open(self, part: str) -> IO[bytes]:
+        """Return a binary stream over ``part`` suitable for ``iterparse``."""
+
+        return io.BytesIO(self.read(part))
+
+    def close(self) -> None:
+        self._parts.clear()
+        self._zipf.close()
+
+    def __enter__(self) -> DocxContext:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -2,19 +2,18 @@
 from __future__ import annotations
 
 import zipfile
-from pathlib import Path, PurePosixPath
-from tempfile import NamedTemporaryFile
-from typing import Iterable, List
-from uuid import uuid4
+from functools import lru_cache
+from pathlib import PurePosixPath
+from typing import IO, Iterable, List
 
 from lxml import etree
 
-from lawdocx.io_utils import InputSource
+from lawdocx.io_utils import InputSource, iter_collector_targets
 from lawdocx.models import Finding
 from lawdocx.utils import (
     build_envelope,
-    hash_bytes,
-    text_context,
+    new_finding_id,
+    text_contexts,
     utc_timestamp,
 )
 
@@ -22,6 +21,10 @@ WORD_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
 RELATIONSHIP_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/relationships"
 OFFICE_REL_NAMESPACE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
 NS = {"w": WORD_NAMESPACE}
+T_TAG = f"{{{WORD_NAMESPACE}}}t"
+
+# DOCX parts never need ID indexing or entity expansion; one parser is reused per module.
+_PARSER = etree.XMLParser(collect_ids=False, resolve_entities=False)
 
 
 def _base_location(story: str, paragraph_index: int) -> dict:
@@ -34,7 +37,7 @@ def _base_location(story: str, paragraph_index: int) -> dict:
 
 def _error_finding(file_index: int, message: str) -> Finding:
     return Finding(
-        id=uuid4().hex[:8],
+        id=new_finding_id(),
         type="footnote",
         severity="error",
         location=_base_location("main", 0),
@@ -43,50 +46,39 @@ def _error_finding(file_index: int, message: str) -> Finding:
     )
 
 
-def _note_text(note_elem: etree._Element) -> str:
-    paragraphs = note_elem.findall(".//w:p", namespaces=NS)
+def _note_text(paragraphs: list[etree._Element]) -> str:
     if not paragraphs:
         return ""
 
-    def _paragraph_text(paragraph: etree._Element) -> str:
-        texts = []
-        for text_node in paragraph.findall(".//w:t", namespaces=NS):
-            if text_node.text:
-                texts.append(text_node.text)
-        return "".join(texts)
-
-    return "\n".join(_paragraph_text(paragraph) for paragraph in paragraphs)
+    return "\n".join(
+        "".join(paragraph.itertext(T_TAG, with_tail=False)) for paragraph in paragraphs
+    )
 
 
-def _load_notes_from_bytes(xml_bytes: bytes | None, note_tag: str) -> dict[int, str]:
+def _parse_notes(
+    xml_bytes: bytes | None, note_tag: str
+) -> tuple[dict[int, str], list[tuple[str, list[etree._Element]]]]:
     if not xml_bytes:
-        return {}
+        return {}, []
 
-    root = etree.fromstring(xml_bytes)
+    root = etree.fromstring(xml_bytes, _PARSER)
     notes: dict[int, str] = {}
+    stories: list[tuple[str, list[etree._Element]]] = []
 
-    for note in root.findall(f".//w:{note_tag}", namespaces=NS):
+    for note in root.iterfind(f".//w:{note_tag}", namespaces=NS):
         note_id = note.get(f"{{{WORD_NAMESPACE}}}id")
-        if note_id is None:
-            continue
         try:
-            parsed_id = int(note_id)
+            parsed_id = int(note_id) if note_id is not None else None
         except ValueError:
+            parsed_id = None
+        if parsed_id is None or parsed_id <= 0:
             continue
-        if parsed_id <= 0:
-            continue
-        notes[parsed_id] = _note_text(note)
 
-    return notes
-
-
-def _load_notes(zipf: zipfile.ZipFile, filename: str, note_tag: str) -> dict[int, str]:
-    try:
-        xml_bytes = zipf.read(filename)
-    except KeyError:
-        return {}
+        paragraphs = note.findall(".//w:p", namespaces=NS)
+        notes[parsed_id] = _note_text(paragraphs)
+        stories.append((f"{note_tag}--{parsed_id}", paragraphs))
 
-    return _load_notes_from_bytes(xml_bytes, note_tag)
+    return notes, stories
 
 
 def _paragraph_text_and_refs(paragraph: etree._Element) -> tuple[str, list[dict]]:
@@ -131,10 +123,10 @@ def _relationship_targets(zipf: zipfile.ZipFile, rels_path: str) -> dict[str, st
     except KeyError:
         return {}
 
-    root = etree.fromstring(rels_xml)
+    root = etree.fromstring(rels_xml, _PARSER)
     targets: dict[str, str] = {}
 
-    for rel in root.findall(f".//{{{RELATIONSHIP_NAMESPACE}}}Relationship"):
+    for rel in root.iterfind(f".//{{{RELATIONSHIP_NAMESPACE}}}Relationship"):
         rid = rel.get("Id")
         target = rel.get("Target")
         if rid and target:
@@ -143,42 +135,21 @@ def _relationship_targets(zipf: zipfile.ZipFile, rels_path: str) -> dict[str, st
     return targets
 
 
+@lru_cache(maxsize=256)
 def _resolve_target(base_part: str, target: str) -> str:
     base_dir = PurePosixPath(base_part).parent
     return base_dir.joinpath(PurePosixPath(target)).as_posix()
 
 
-def _iter_note_stories(xml_bytes: bytes | None, note_tag: str) -> list[tuple[str, list[etree._Element]]]:
-    if not xml_bytes:
-        return []
-
-    root = etree.fromstring(xml_bytes)
-    stories: list[tuple[str, list[etree._Element]]] = []
-
-    for note in root.findall(f".//w:{note_tag}", namespaces=NS):
-        note_id = note.get(f"{{{WORD_NAMESPACE}}}id")
-        try:
-            parsed_id = int(note_id) if note_id is not None else None
-        except ValueError:
-            parsed_id = None
-        if parsed_id is None or parsed_id <= 0:
-            continue
-
-        paragraphs = note.findall(".//w:p", namespaces=NS)
-        stories.append((f"{note_tag}--{parsed_id}", paragraphs))
-
-    return stories
-
-
 def _header_footer_stories(
     document_root: etree._Element, rels_map: dict[str, str], zipf: zipfile.ZipFile
 ) -> list[tuple[str, list[etree._Element]]]:
     stories: list[tuple[str, list[etree._Element]]] = []
-    sect_prs = document_root.findall(".//w:sectPr", namespaces=NS)
+    sect_prs = document_root.iterfind(".//w:sectPr", namespaces=NS)
 
     for section_index, sect in enumerate(sect_prs, start=1):
         for ref_tag, prefix in (("headerReference", "header"), ("footerReference", "footer")):
-            for ref in sect.findall(f"w:{ref_tag}", namespaces=NS):
+            for ref in sect.iterfind(f"w:{ref_tag}", namespaces=NS):
                 rel_id = ref.get(f"{{{OFFICE_REL_NAMESPACE}}}id")
                 target = rels_map.get(rel_id) if rel_id else None
                 if not target:
@@ -193,7 +164,7 @@ def _header_footer_stories(
                     continue
 
                 try:
-                    part_root = etree.fromstring(part_xml)
+                    part_root = etree.fromstring(part_xml, _PARSER)
                 except etree.XMLSyntaxError:
                     continue
 
@@ -204,7 +175,7 @@ def _header_footer_stories(
     return stories
 
 
-def collect_footnotes(file_path: str, file_index: int = 0) -> list[Finding]:
+def collect_footnotes(file_path: str | IO[bytes], file_index: int = 0) -> list[Finding]:
     findings: list[Finding] = []
 
     try:
@@ -217,24 +188,29 @@ def collect_footnotes(file_path: str, file_index: int = 0) -> list[Finding]:
             endnotes_xml = (
                 zf.read("word/endnotes.xml") if "word/endnotes.xml" in zf.namelist() else None
             )
-            footnotes = _load_notes_from_bytes(footnotes_xml, "footnote")
-            endnotes = _load_notes_from_bytes(endnotes_xml, "endnote")
+            footnotes, footnote_stories = _parse_notes(footnotes_xml, "footnote")
+            endnotes, endnote_stories = _parse_notes(endnotes_xml, "endnote")
 
-            document_root = etree.fromstring(document_xml)
+            document_root = etree.fromstring(document_xml, _PARSER)
             stories: list[tuple[str, list[etree._Element]]] = []
 
             body_paragraphs = document_root.findall(".//w:body//w:p", namespaces=NS)
             stories.append(("main", body_paragraphs))
 
             stories.extend(_header_footer_stories(document_root, rels_map, zf))
-            stories.extend(_iter_note_stories(footnotes_xml, "footnote"))
-            stories.extend(_iter_note_stories(endnotes_xml, "endnote"))
+            stories.extend(footnote_stories)
+            stories.extend(endnote_stories)
 
             for story, paragraphs in stories:
                 for para_index, paragraph in enumerate(paragraphs):
                     paragraph_text, references = _paragraph_text_and_refs(paragraph)
+                    if not references:
+                        continue
 
-                    for ref in references:
+                    contexts = text_contexts(
+                        paragraph_text, [(ref["start"], ref["end"]) for ref in references]
+                    )
+                    for ref, context in zip(references, contexts):
                         note_map = footnotes if ref["type"] == "footnote" else endnotes
                         note_text = note_map.get(ref["id"], "") if ref["id"] is not None else ""
                         details = {
@@ -247,11 +223,11 @@ def collect_footnotes(file_path: str, file_index: int = 0) -> list[Finding]:
 
                         findings.append(
                             Finding(
-                                id=uuid4().hex[:8],
+                                id=new_finding_id(),
                                 type=ref["type"],
                                 severity="info",
                                 location=_base_location(story, para_index),
-                                context=text_context(paragraph_text, ref["start"], ref["end"]),
+                                context=context,
                                 details=details,
                             )
                         )
@@ -265,20 +241,8 @@ def run_footnotes(inputs: Iterable[InputSource]) -> dict:
     generated_at = utc_timestamp()
     merged_files: List[dict] = []
 
-    for file_index, source in enumerate(inputs):
-        data = source.handle.read()
-        sha256 = hash_bytes(data)
-
-        temp_path: str | None = None
-        if source.is_stdin:
-            with NamedTemporaryFile(delete=False, suffix=".docx") as temp:
-                temp.write(data)
-                temp_path = temp.name
-            target_path = temp_path
-        else:
-            target_path = source.path
-
-        findings = collect_footnotes(target_path, file_index)
+    for file_index, (source, sha256, target) in enumerate(iter_collector_targets(inputs)):
+        findings = collect_footnotes(target, file_index)
 
         file_entry = {
             "path": source.display_name,
@@ -286,9 +250,6 @@ def run_footnotes(inputs: Iterable[InputSource]) -> dict:
             "items": [f.as_dict() for f in findings],
         }
 
-        if temp_path:
-            Path(temp_path).unlink(missing_ok=True)
-
         merged_files.append(file_entry)
 
     return build_envelope(
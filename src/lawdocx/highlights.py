@@ -2,24 +2,26 @@
 from __future__ import annotations
 
 import zipfile
-from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Iterable, List
-from uuid import uuid4
+from typing import IO, Iterable, List
 
 from lxml import etree
 
-from lawdocx.io_utils import InputSource
+from lawdocx.io_utils import InputSource, iter_collector_targets
 from lawdocx.models import Finding
 from lawdocx.utils import (
     build_envelope,
-    hash_bytes,
-    text_context,
+    new_finding_id,
+    text_contexts,
     utc_timestamp,
 )
 
 WORD_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
 NS = {"w": WORD_NAMESPACE}
+T_TAG = f"{{{WORD_NAMESPACE}}}t"
+
+_PARSER = etree.XMLParser(collect_ids=False, resolve_entities=False)
+
+STORY_PARTS = {"word/document.xml", "word/footnotes.xml", "word/endnotes.xml"}
 
 
 def _base_location(story: str, paragraph_index: int) -> dict:
@@ -32,7 +34,7 @@ def _base_location(story: str, paragraph_index: int) -> dict:
 
 def _error_finding(message: str, *, file_index: int = 0) -> Finding:
     return Finding(
-        id=uuid4().hex[:8],
+        id=new_finding_id(),
         type="highlight",
         severity="error",
         location=_base_location("body", 0),
@@ -42,11 +44,9 @@ def _error_finding(message: str, *, file_index: int = 0) -> Finding:
 
 
 def _run_text(run: etree._Element) -> str:
-    texts: list[str] = []
-    for node in run.findall(".//w:t", namespaces=NS):
-        if node.text:
-            texts.append(node.text)
-    return "".join(texts)
+    # itertext() walks in C; tails are excluded so indentation between
+    # elements never leaks into the run text.
+    return "".join(run.itertext(T_TAG, with_tail=False))
 
 
 def _paragraph_highlights(paragraph: etree._Element) -> tuple[str, list[dict]]:
@@ -54,7 +54,7 @@ def _paragraph_highlights(paragraph: etree._Element) -> tuple[str, list[dict]]:
     highlights: list[dict] = []
     current_length = 0
 
-    for run in paragraph.findall(".//w:r", namespaces=NS):
+    for run in paragraph.iterfind(".//w:r", namespaces=NS):
         run_text = _run_text(run)
         start = current_length
         current_length += len(run_text)
@@ -75,34 +75,44 @@ def _paragraph_highlights(paragraph: etree._Element) -> tuple[str, list[dict]]:
     return "".join(parts), highlights
 
 
+def _paragraph_findings(
+    paragraph: etree._Element, story: str, paragraph_index: int, findings: list[Finding]
+) -> None:
+    paragraph_text, highlight_records = _paragraph_highlights(paragraph)
+    if not highlight_records:
+        return
+
+    contexts = text_contexts(
+        paragraph_text, [(record["start"], record["end"]) for record in highlight_records]
+    )
+    for record, context in zip(highlight_records, contexts):
+        findings.append(
+            Finding(
+                id=new_finding_id(),
+                type="highlight",
+                severity="warning",
+                location=_base_location(story, paragraph_index),
+                context=context,
+                details={"highlight_color": record["color"]},
+            )
+        )
+
+
 def _collect_story_highlights(xml_bytes: bytes, story: str, findings: list[Finding]) -> None:
-    root = etree.fromstring(xml_bytes)
-    paragraphs = root.findall(".//w:p", namespaces=NS)
+    root = etree.fromstring(xml_bytes, _PARSER)
+    paragraphs = root.iterfind(".//w:p", namespaces=NS)
 
     for para_index, paragraph in enumerate(paragraphs):
-        paragraph_text, highlight_records = _paragraph_highlights(paragraph)
-        for record in highlight_records:
-            findings.append(
-                Finding(
-                    id=uuid4().hex[:8],
-                    type="highlight",
-                    severity="warning",
-                    location=_base_location(story, para_index),
-                    context=text_context(
-                        paragraph_text, record["start"], record["end"]
-                    ),
-                    details={"highlight_color": record["color"]},
-                )
-            )
+        _paragraph_findings(paragraph, story, para_index, findings)
 
 
 def _collect_notes_highlights(
     xml_bytes: bytes, story: str, note_tag: str, findings: list[Finding]
 ) -> None:
-    root = etree.fromstring(xml_bytes)
+    root = etree.fromstring(xml_bytes, _PARSER)
     paragraph_index = 0
 
-    for note in root.findall(f".//w:{note_tag}", namespaces=NS):
+    for note in root.iterfind(f".//w:{note_tag}", namespaces=NS):
         note_id = note.get(f"{{{WORD_NAMESPACE}}}id")
         try:
             parsed_id = int(note_id) if note_id is not None else None
@@ -111,46 +121,40 @@ def _collect_notes_highlights(
         if parsed_id is None or parsed_id <= 0:
             continue
 
-        for paragraph in note.findall(".//w:p", namespaces=NS):
-            paragraph_text, highlight_records = _paragraph_highlights(paragraph)
-            for record in highlight_records:
-                findings.append(
-                    Finding(
-                        id=uuid4().hex[:8],
-                        type="highlight",
-                        severity="warning",
-                        location=_base_location(story, paragraph_index),
-                        context=text_context(
-                            paragraph_text, record["start"], record["end"]
-                        ),
-                        details={"highlight_color": record["color"]},
-                    )
-                )
+        for paragraph in note.iterfind(".//w:p", namespaces=NS):
+            _paragraph_findings(paragraph, story, paragraph_index, findings)
             paragraph_index += 1
 
 
-def collect_highlights(file_path: str, file_index: int = 0) -> list[Finding]:
+def _is_story_part(name: str) -> bool:
+    if name in STORY_PARTS:
+        return True
+    return name.startswith(("word/header", "word/footer")) and name.endswith(".xml")
+
+
+def _read_story_parts(zipf: zipfile.ZipFile) -> dict[str, bytes]:
+    """Read every story part in one directory scan, in archive order."""
+
+    wanted = [info for info in zipf.infolist() if _is_story_part(info.filename)]
+    wanted.sort(key=lambda info: info.header_offset)
+    return {info.filename: zipf.read(info) for info in wanted}
+
+
+def collect_highlights(file_path: str | IO[bytes], file_index: int = 0) -> list[Finding]:
     findings: list[Finding] = []
 
     try:
         with zipfile.ZipFile(file_path) as zf:
-            document_xml = zf.read("word/document.xml")
+            parts = _read_story_parts(zf)
+            document_xml = parts["word/document.xml"]
             header_parts = {
-                name: zf.read(name)
-                for name in zf.namelist()
-                if name.startswith("word/header") and name.endswith(".xml")
+                name: data for name, data in parts.items() if name.startswith("word/header")
             }
             footer_parts = {
-                name: zf.read(name)
-                for name in zf.namelist()
-                if name.startswith("word/footer") and name.endswith(".xml")
+                name: data for name, data in parts.items() if name.startswith("word/footer")
             }
-            footnotes_xml = (
-                zf.read("word/footnotes.xml") if "word/footnotes.xml" in zf.namelist() else None
-            )
-            endnotes_xml = (
-                zf.read("word/endnotes.xml") if "word/endnotes.xml" in zf.namelist() else None
-            )
+            footnotes_xml = parts.get("word/footnotes.xml")
+            endnotes_xml = parts.get("word/endnotes.xml")
     except Exception as exc:  # pragma: no cover - defensive
         return [_error_finding(f"Failed to open DOCX: {exc}", file_index=file_index)]
 
@@ -174,20 +178,8 @@ def run_highlights(inputs: Iterable[InputSource]) -> dict:
     generated_at = utc_timestamp()
     merged_files: List[dict] = []
 
-    for file_index, source in enumerate(inputs):
-        data = source.handle.read()
-        sha256 = hash_bytes(data)
-
-        temp_path: str | None = None
-        if source.is_stdin:
-            with NamedTemporaryFile(delete=False, suffix=".docx") as temp:
-                temp.write(data)
-                temp_path = temp.name
-            target_path = temp_path
-        else:
-            target_path = source.path
-
-        findings = collect_highlights(target_path, file_index)
+    for file_index, (source, sha256, target) in enumerate(iter_collector_targets(inputs)):
+        findings = collect_highlights(target, file_index)
 
         file_entry = {
             "path": source.display_name,
@@ -195,9 +187,6 @@ def run_highlights(inputs: Iterable[InputSource]) -> dict:
             "items": [f.as_dict() for f in findings],
         }
 
-        if temp_path:
-            Path(temp_path).unlink(missing_ok=True)
-
         merged_files.append(file_entry)
 
     return build_envelope(
@@ -6,10 +6,12 @@ import io
 import os
 import sys
 from dataclasses import dataclass
-from typing import IO, Iterable, List, Optional, Sequence, Tuple, Union
+from typing import IO, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 import click
 
+from lawdocx.utils import hash_bytes, hash_stream
+
 
 @dataclass
 class InputSource:
@@ -39,14 +41,13 @@ def resolve_inputs(paths: Sequence[str], mode: str = "rb") -> InputList:
     Expands glob patterns, de-duplicates resolved paths, and handles stdin markers.
     """
 
-    resolved: InputList = []
-    seen: set[str] = set()
+    resolved: dict[str, InputSource] = {}
+    cwd = os.getcwd()
 
     for raw_path in paths:
         if raw_path == "-":
-            if any(source.is_stdin for source in resolved):
-                continue
-            resolved.append(InputSource(path="-", handle=_stdin_handle(mode), is_stdin=True))
+            if "-" not in resolved:
+                resolved["-"] = InputSource(path="-", handle=_stdin_handle(mode), is_stdin=True)
             continue
 
         matches = glob.glob(raw_path)
@@ -54,22 +55,19 @@ def resolve_inputs(paths: Sequence[str], mode: str = "rb") -> InputList:
             raise click.ClickException(f"No files matched pattern: {raw_path}")
 
         for match in matches:
-            absolute = os.path.abspath(match)
-            if absolute in seen:
+            absolute = os.path.normpath(os.path.join(cwd, match))
+            if absolute in resolved:
                 continue
-            seen.add(absolute)
             try:
                 handle = open(absolute, mode)
             except OSError as exc:  # pragma: no cover - thin wrapper
                 raise click.ClickException(str(exc)) from exc
-            resolved.append(InputSource(path=absolute, handle=handle))
+            resolved[absolute] = InputSource(path=absolute, handle=handle)
 
     if not resolved:
         raise click.ClickException("No input files provided")
 
-    resolved.sort(key=lambda source: source.path)
-
-    return resolved
+    return sorted(resolved.values(), key=lambda source: source.path)
 
 
 def resolve_output_handle(
@@ -86,14 +84,41 @@ def resolve_output_handle(
     if isinstance(output, str):
         if output == "-":
             return click.get_text_stream("stdout"), False
+        encoding = None if "b" in mode else "utf-8"
         try:
-            return open(output, mode), True
+            return open(output, mode, encoding=encoding), True
         except OSError as exc:  # pragma: no cover - thin wrapper
             raise click.ClickException(str(exc)) from exc
 
     raise click.ClickException("Invalid output destination")
 
 
+def iter_collector_targets(
+    inputs: Iterable[InputSource],
+) -> Iterator[Tuple[InputSource, str, Union[str, IO[bytes]]]]:
+    """Yield each input with its SHA-256 digest and the target to collect from.
+
+    Inputs backed by a file on disk are hashed by streaming their open handle
+    and collected from their path, which worker processes can reopen. Stdin and
+    in-memory handles are read once and collected from a ``BytesIO``.
+    """
+
+    for source in inputs:
+        if source.is_stdin or not _has_fileno(source.handle):
+            data = source.handle.read()
+            yield source, hash_bytes(data), io.BytesIO(data)
+        else:
+            yield source, hash_stream(source.handle), source.path
+
+
+def _has_fileno(handle: IO) -> bool:
+    try:
+        handle.fileno()
+    except (AttributeError, OSError):
+        return False
+    return True
+
+
 def close_inputs(inputs: Iterable[InputSource]) -> None:
     """Close any non-stdin input handles."""
 
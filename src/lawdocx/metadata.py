@@ -2,16 +2,36 @@
 from __future__ import annotations
 
 import os
-from tempfile import NamedTemporaryFile
-from typing import Iterable, List
-from uuid import uuid4
+from typing import IO, Iterable, List
 
-from docx2python import docx2python
 from lxml import etree
 
-from lawdocx.io_utils import InputSource
+from lawdocx.docx_context import DocxContext
+from lawdocx.io_utils import InputSource, iter_collector_targets
 from lawdocx.models import Finding
-from lawdocx.utils import build_envelope, hash_bytes, utc_timestamp
+from lawdocx.utils import (
+    build_envelope,
+    map_inputs,
+    new_finding_id,
+    utc_timestamp,
+)
+
+PACKAGE_RELS_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/relationships"
+PROPERTY_PART_TYPES = {
+    "core": "/metadata/core-properties",
+    "extended": "/extended-properties",
+    "custom": "/custom-properties",
+}
+
+_PARSER = etree.XMLParser(collect_ids=False, resolve_entities=False)
+
+METADATA_PARTS = (
+    "_rels/.rels",
+    "docProps/core.xml",
+    "docProps/app.xml",
+    "docProps/custom.xml",
+    "word/_rels/document.xml.rels",
+)
 
 
 def _base_location() -> dict:
@@ -43,7 +63,7 @@ def _metadata_finding(
         details.update(extra_details)
 
     return Finding(
-        id=uuid4().hex[:8],
+        id=new_finding_id(),
         type="metadata",
         severity=severity,
         location=_base_location(),
@@ -54,7 +74,7 @@ def _metadata_finding(
 
 def _error_finding(message: str) -> Finding:
     return Finding(
-        id=uuid4().hex[:8],
+        id=new_finding_id(),
         type="metadata",
         severity="error",
         location=_base_location(),
@@ -80,11 +100,43 @@ def _extract_simple_properties(
     return findings
 
 
-def _extract_extended_properties(files: list) -> list[Finding]:
+def _property_parts(package: DocxContext) -> dict[str, etree._Element]:
+    try:
+        rels_root = etree.fromstring(package.read("_rels/.rels"), _PARSER)
+    except KeyError:
+        return {}
+
+    parts: dict[str, etree._Element] = {}
+    for rel in rels_root.iterfind(f"{{{PACKAGE_RELS_NAMESPACE}}}Relationship"):
+        rel_type = rel.get("Type", "")
+        for category, suffix in PROPERTY_PART_TYPES.items():
+            if category in parts or not rel_type.endswith(suffix):
+                continue
+            target = rel.get("Target", "").lstrip("/")
+            try:
+                parts[category] = etree.fromstring(package.read(target), _PARSER)
+            except KeyError:
+                pass
+    return parts
+
+
+def _core_properties(root: etree._Element | None) -> dict[str, str | None]:
+    if root is None:
+        return {}
+    return {
+        etree.QName(child).localname: child.text
+        for child in root
+        if isinstance(child.tag, str)
+    }
+
+
+def _extract_extended_properties(root: etree._Element | None) -> list[Finding]:
     findings: list[Finding] = []
-    for doc_file in files:
+    if root is not None:
         try:
-            for child in doc_file.root_element:
+            for child in root:
+                if not isinstance(child.tag, str):
+                    continue
                 name = etree.QName(child).localname
                 value = child.text or ""
                 findings.append(
@@ -100,11 +152,11 @@ def _extract_extended_properties(files: list) -> list[Finding]:
     return findings
 
 
-def _extract_custom_properties(files: list) -> list[Finding]:
+def _extract_custom_properties(root: etree._Element | None) -> list[Finding]:
     findings: list[Finding] = []
-    for doc_file in files:
+    if root is not None:
         try:
-            for prop in doc_file.root_element.findall(".//{*}property"):
+            for prop in root.iterfind(".//{*}property"):
                 name = prop.get("name", "")
                 if len(prop):
                     value_elem = prop[0]
@@ -127,15 +179,15 @@ def _extract_custom_properties(files: list) -> list[Finding]:
     return findings
 
 
-def _extract_custom_xml_files(reader) -> list[Finding]:
+def _extract_custom_xml_files(package: DocxContext) -> list[Finding]:
     custom_xml_rel_type = (
         "http://schemas.openxmlformats.org/officeDocument/2006/relationships/customXml"
     )
     relationships_path = "word/_rels/document.xml.rels"
 
     try:
-        rels_bytes = reader.zipf.read(relationships_path)
-        rels_root = etree.fromstring(rels_bytes)
+        rels_bytes = package.read(relationships_path)
+        rels_root = etree.fromstring(rels_bytes, _PARSER)
         custom_paths: list[str] = []
 
         for rel in rels_root.findall(
@@ -175,72 +227,63 @@ def _extract_custom_xml_files(reader) -> list[Finding]:
         return [_error_finding(f"Custom XML detection failed: {exc}")]
 
 
-def collect_metadata(file_path: str) -> list[Finding]:
+def _scan_package(package: DocxContext) -> list[Finding]:
+    findings: list[Finding] = []
+    try:
+        package.prefetch(METADATA_PARTS)
+        parts = _property_parts(package)
+        findings.extend(
+            _extract_simple_properties(_core_properties(parts.get("core")), "core")
+        )
+        findings.extend(_extract_extended_properties(parts.get("extended")))
+        findings.extend(_extract_custom_properties(parts.get("custom")))
+        findings.extend(_extract_custom_xml_files(package))
+    except Exception as exc:  # pragma: no cover - defensive
+        findings.append(_error_finding(f"Metadata extraction failed: {exc}"))
+
+    return findings
+
+
+def collect_metadata(file_path: str | IO[bytes] | DocxContext) -> list[Finding]:
     """Extract metadata from a DOCX file.
 
     The ``collect_*`` helpers form the minimal interface for tool modules: they
-    accept a path to the working file and return a list of serializable finding
-    objects.
+    accept a path to the working file (or an open binary stream, or a
+    ``DocxContext`` shared with other tools) and return a list of serializable
+    finding objects.
     Keeping this surface small helps future tools stay well under the
     150-line-per-module guideline.
     """
 
-    findings: list[Finding] = []
+    if isinstance(file_path, DocxContext):
+        return _scan_package(file_path)
+
     try:
-        content = docx2python(file_path)
+        package = DocxContext(file_path)
     except Exception as exc:
         return [_error_finding(f"Failed to open DOCX: {exc}")]
 
-    try:
-        findings.extend(
-            _extract_simple_properties(content.core_properties, "core")
-        )
+    with package:
+        return _scan_package(package)
 
-        extended_files = content.docx_reader.files_of_type("extended-properties")
-        findings.extend(_extract_extended_properties(extended_files))
 
-        custom_files = content.docx_reader.files_of_type("custom-properties")
-        findings.extend(_extract_custom_properties(custom_files))
-        findings.extend(_extract_custom_xml_files(content.docx_reader))
-    except Exception as exc:  # pragma: no cover - defensive
-        findings.append(_error_finding(f"Metadata extraction failed: {exc}"))
-    finally:
-        content.close()
+def run_metadata(inputs: Iterable[InputSource], *, workers: int = 1) -> dict:
+    """Extract metadata for one or more input sources.
 
-    return findings
-
-
-def run_metadata(inputs: Iterable[InputSource]) -> dict:
-    """Extract metadata for one or more input sources."""
+    With ``workers`` above one, files are read in up to that many processes.
+    """
 
     generated_at = utc_timestamp()
     merged_files: List[dict] = []
+    calls: list[tuple] = []
 
-    for source in inputs:
-        data = source.handle.read()
-        sha256 = hash_bytes(data)
-
-        temp_path: str | None = None
-        if source.is_stdin:
-            with NamedTemporaryFile(delete=False, suffix=".docx") as temp:
-                temp.write(data)
-                temp_path = temp.name
-            target_path = temp_path
-        else:
-            target_path = source.path
-
-        findings = collect_metadata(target_path)
-
-        file_entry = {
-            "path": source.display_name,
-            "sha256": sha256,
-            "items": [f.as_dict() for f in findings],
-        }
-
-        if temp_path:
-            os.unlink(temp_path)
+    for source, sha256, target in iter_collector_targets(inputs):
+        calls.append((target,))
+        merged_files.append({"path": source.display_name, "sha256": sha256})
 
-        merged_files.append(file_entry)
+    results = map_inputs(collect_metadata, calls, workers=workers)
+    for file_entry, findings in zip(merged_files, results):
+        file_entry["items"] = [f.as_dict() for f in findings]
 
     return build_envelope(
         tool="lawdocx-metadata", files=merged_files, generated_at=generated_at
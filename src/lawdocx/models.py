@@ -8,6 +8,8 @@ from dataclasses import dataclass
 class Finding:
     """Simple representation of a finding object for tool outputs."""
 
+    __slots__ = ("id", "type", "severity", "location", "context", "details")
+
     id: str
     type: str
     severity: str
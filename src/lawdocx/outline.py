@@ -2,37 +2,49 @@
 from __future__ import annotations
 
 import re
-import zipfile
-from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Iterable, List
-from uuid import uuid4
+from functools import lru_cache
+from typing import IO, Iterable, Iterator, List
 
 from lxml import etree
 
-from lawdocx.io_utils import InputSource
+from lawdocx.docx_context import DocxContext
+from lawdocx.io_utils import InputSource, iter_collector_targets
 from lawdocx.models import Finding
 from lawdocx.utils import (
     build_envelope,
-    hash_bytes,
+    map_inputs,
+    new_finding_id,
     text_context,
     utc_timestamp,
 )
 
 WORD_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
 
-NS = {"w": WORD_NAMESPACE}
+P_TAG = f"{{{WORD_NAMESPACE}}}p"
+T_TAG = f"{{{WORD_NAMESPACE}}}t"
+STYLE_TAG = f"{{{WORD_NAMESPACE}}}style"
+NAME_TAG = f"{{{WORD_NAMESPACE}}}name"
+PPR_TAG = f"{{{WORD_NAMESPACE}}}pPr"
+PSTYLE_TAG = f"{{{WORD_NAMESPACE}}}pStyle"
+NUMPR_TAG = f"{{{WORD_NAMESPACE}}}numPr"
+VAL_ATTR = f"{{{WORD_NAMESPACE}}}val"
+STYLE_ID_ATTR = f"{{{WORD_NAMESPACE}}}styleId"
+
+_PARSER = etree.XMLParser(collect_ids=False, resolve_entities=False)
+
+MANUAL_NUMBERING_RE = re.compile(
+    r"\s*(?:"
+    r"\d+[.)]\s"
+    r"|\d+\.[A-Za-z]\s"
+    r"|\([A-Za-z]\)\s"
+    r"|[ivxlcdmIVXLCDM]+[.)]\s"
+    r")"
+)
 
-MANUAL_NUMBERING_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(r"^\s*\d+\.\s"),
-    re.compile(r"^\s*\d+\)\s"),
-    re.compile(r"^\s*\d+\.[A-Za-z]\s"),
-    re.compile(r"^\s*\([A-Za-z]\)\s"),
-    re.compile(r"^\s*[ivxlcdm]+\)\s", re.IGNORECASE),
-    re.compile(r"^\s*[ivxlcdm]+\.\s", re.IGNORECASE),
-]
+# First characters MANUAL_NUMBERING_RE can match after leading whitespace.
+NUMBERING_START_CHARS = frozenset("0123456789(ivxlcdmIVXLCDM")
 
-HEADING_KEYWORDS = ["heading ", "title", "article", "section", "clause", "heading-"]
+HEADING_RE = re.compile(r"heading[ -]|title|article|section|clause")
 
 
 def _base_location(paragraph_index: int) -> dict:
@@ -45,7 +57,7 @@ def _base_location(paragraph_index: int) -> dict:
 
 def _error_finding(message: str) -> Finding:
     return Finding(
-        id=uuid4().hex[:8],
+        id=new_finding_id(),
         type="outline",
         severity="error",
         location=_base_location(0),
@@ -55,134 +67,145 @@ def _error_finding(message: str) -> Finding:
 
 
 def _paragraph_text(paragraph: etree._Element) -> str:
-    texts: list[str] = []
-    for text_node in paragraph.findall(".//w:t", namespaces=NS):
-        if text_node.text:
-            texts.append(text_node.text)
-    return "".join(texts)
+    return "".join(paragraph.itertext(T_TAG, with_tail=False))
+
+
+def _first_child(element: etree._Element | None, tag: str) -> etree._Element | None:
+    if element is None:
+        return None
+    return next(element.iterchildren(tag), None)
 
 
-def _load_styles(zipf: zipfile.ZipFile) -> dict[str, str]:
+def _iter_paragraphs(stream: IO[bytes]) -> Iterator[etree._Element]:
+    for _, paragraph in etree.iterparse(
+        stream,
+        events=("end",),
+        tag=P_TAG,
+        collect_ids=False,
+        resolve_entities=False,
+    ):
+        yield paragraph
+        paragraph.clear(keep_tail=True)
+        parent = paragraph.getparent()
+        if parent is not None:
+            del parent[: parent.index(paragraph)]
+
+
+def _load_styles(package: DocxContext) -> dict[str, str]:
     try:
-        xml_bytes = zipf.read("word/styles.xml")
+        xml_bytes = package.read("word/styles.xml")
     except KeyError:
         return {}
 
-    root = etree.fromstring(xml_bytes)
+    root = etree.fromstring(xml_bytes, _PARSER)
     styles: dict[str, str] = {}
 
-    for style in root.findall(".//w:style", namespaces=NS):
-        style_id = style.get(f"{{{WORD_NAMESPACE}}}styleId")
-        name_elem = style.find("w:name", namespaces=NS)
-        style_name = name_elem.get(f"{{{WORD_NAMESPACE}}}val") if name_elem is not None else None
+    for style in root.iter(STYLE_TAG):
+        style_id = style.get(STYLE_ID_ATTR)
+        name_elem = _first_child(style, NAME_TAG)
+        style_name = name_elem.get(VAL_ATTR) if name_elem is not None else None
         if style_id and style_name:
             styles[style_id] = style_name
 
     return styles
 
 
+@lru_cache(maxsize=256)
 def _is_heading_style(style_name: str | None) -> bool:
     if not style_name:
         return False
-    lowered = style_name.lower()
-    return any(keyword in lowered for keyword in HEADING_KEYWORDS)
+    return HEADING_RE.search(style_name.lower()) is not None
 
 
 def _has_manual_numbering(text: str) -> bool:
-    return any(pattern.search(text) for pattern in MANUAL_NUMBERING_PATTERNS)
+    first = text.lstrip()[:1]
+    # \d also matches non-ASCII digits, which the ASCII set does not cover.
+    if first not in NUMBERING_START_CHARS and not first.isdigit():
+        return False
+    return MANUAL_NUMBERING_RE.match(text) is not None
 
 
-def collect_outline(file_path: str, file_index: int = 0) -> list[Finding]:
+def _paragraph_finding(
+    paragraph: etree._Element, para_index: int, styles: dict[str, str]
+) -> Finding | None:
+    text = _paragraph_text(paragraph)
+    properties = _first_child(paragraph, PPR_TAG)
+    style_elem = _first_child(properties, PSTYLE_TAG)
+    style_id = style_elem.get(VAL_ATTR) if style_elem is not None else None
+    style_name = styles.get(style_id, style_id or "")
+
+    if _is_heading_style(style_name):
+        return None
+
+    if _has_manual_numbering(text):
+        severity, category = "error", "manual_numbering"
+    elif _first_child(properties, NUMPR_TAG) is not None:
+        severity, category = "warning", "suspicious_numbering"
+    else:
+        return None
+
+    return Finding(
+        id=new_finding_id(),
+        type="outline",
+        severity=severity,
+        location=_base_location(para_index),
+        context=text_context(text, 0, min(len(text), 80), target_limit=80),
+        details={
+            "category": category,
+            "style_name": style_name,
+        },
+    )
+
+
+def _scan_package(package: DocxContext) -> list[Finding]:
     findings: list[Finding] = []
 
     try:
-        with zipfile.ZipFile(file_path) as zf:
-            document_xml = zf.read("word/document.xml")
-            styles = _load_styles(zf)
+        package.prefetch(("word/document.xml", "word/styles.xml"))
+        styles = _load_styles(package)
+        document = package.open("word/document.xml")
     except Exception as exc:  # pragma: no cover - defensive
         return [_error_finding(f"Failed to open DOCX: {exc}")]
 
     try:
-        root = etree.fromstring(document_xml)
-        paragraphs = root.findall(".//w:body//w:p", namespaces=NS)
-
-        for para_index, paragraph in enumerate(paragraphs):
-            text = _paragraph_text(paragraph)
-            style_elem = paragraph.find("./w:pPr/w:pStyle", namespaces=NS)
-            style_id = (
-                style_elem.get(f"{{{WORD_NAMESPACE}}}val") if style_elem is not None else None
-            )
-            style_name = styles.get(style_id, style_id or "")
-
-            if _is_heading_style(style_name):
-                continue
-
-            has_numpr = paragraph.find("./w:pPr/w:numPr", namespaces=NS) is not None
-            manual_numbering = _has_manual_numbering(text)
-
-            if manual_numbering:
-                findings.append(
-                    Finding(
-                        id=uuid4().hex[:8],
-                        type="outline",
-                        severity="error",
-                        location=_base_location(para_index),
-                        context=text_context(text, 0, min(len(text), 80), target_limit=80),
-                        details={
-                            "category": "manual_numbering",
-                            "style_name": style_name,
-                        },
-                    )
-                )
-            elif has_numpr:
-                findings.append(
-                    Finding(
-                        id=uuid4().hex[:8],
-                        type="outline",
-                        severity="warning",
-                        location=_base_location(para_index),
-                        context=text_context(text, 0, min(len(text), 80), target_limit=80),
-                        details={
-                            "category": "suspicious_numbering",
-                            "style_name": style_name,
-                        },
-                    )
-                )
+        with document:
+            for para_index, paragraph in enumerate(_iter_paragraphs(document)):
+                finding = _paragraph_finding(paragraph, para_index, styles)
+                if finding is not None:
+                    findings.append(finding)
     except Exception as exc:  # pragma: no cover - defensive
         findings.append(_error_finding(f"Outline scan failed: {exc}"))
 
     return findings
 
 
-def run_outline(inputs: Iterable[InputSource]) -> dict:
-    generated_at = utc_timestamp()
-    merged_files: List[dict] = []
+def collect_outline(
+    file_path: str | IO[bytes] | DocxContext, file_index: int = 0
+) -> list[Finding]:
+    if isinstance(file_path, DocxContext):
+        return _scan_package(file_path)
 
-    for file_index, source in enumerate(inputs):
-        data = source.handle.read()
-        sha256 = hash_bytes(data)
+    try:
+        package = DocxContext(file_path)
+    except Exception as exc:  # pragma: no cover - defensive
+        return [_error_finding(f"Failed to open DOCX: {exc}")]
 
-        temp_path: str | None = None
-        if source.is_stdin:
-            with NamedTemporaryFile(delete=False, suffix=".docx") as temp:
-                temp.write(data)
-                temp_path = temp.name
-            target_path = temp_path
-        else:
-            target_path = source.path
+    with package:
+        return _scan_package(package)
 
-        findings = collect_outline(target_path, file_index)
 
-        file_entry = {
-            "path": source.display_name,
-            "sha256": sha256,
-            "items": [f.as_dict() for f in findings],
-        }
+def run_outline(inputs: Iterable[InputSource], *, workers: int = 1) -> dict:
+    generated_at = utc_timestamp()
+    merged_files: List[dict] = []
+    calls: list[tuple] = []
 
-        if temp_path:
-            Path(temp_path).unlink(missing_ok=True)
+    for file_index, (source, sha256, target) in enumerate(iter_collector_targets(inputs)):
+        calls.append((target, file_index))
+        merged_files.append({"path": source.display_name, "sha256": sha256})
 
-        merged_files.append(file_entry)
+    results = map_inputs(collect_outline, calls, workers=workers)
+    for file_entry, findings in zip(merged_files, results):
+        file_entry["items"] = [f.as_dict() for f in findings]
 
     return build_envelope(
         tool="lawdocx-outline", files=merged_files, generated_at=generated_at
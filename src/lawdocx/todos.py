@@ -2,22 +2,36 @@
 from __future__ import annotations
 
 import re
-from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Iterable, List
-from uuid import uuid4
+from functools import lru_cache
+from typing import IO, Iterable, Iterator, List
 
-from docx2python import docx2python
+from lxml import etree
 
-from lawdocx.io_utils import InputSource
+from lawdocx.docx_context import DocxContext
+from lawdocx.io_utils import InputSource, iter_collector_targets
 from lawdocx.models import Finding
 from lawdocx.utils import (
     build_envelope,
-    hash_bytes,
+    map_inputs,
+    new_finding_id,
     text_context,
     utc_timestamp,
 )
 
+WORD_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+RELATIONSHIP_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/relationships"
+P_TAG = f"{{{WORD_NAMESPACE}}}p"
+R_TAG = f"{{{WORD_NAMESPACE}}}r"
+T_TAG = f"{{{WORD_NAMESPACE}}}t"
+TAB_TAG = f"{{{WORD_NAMESPACE}}}tab"
+BR_TAG = f"{{{WORD_NAMESPACE}}}br"
+CR_TAG = f"{{{WORD_NAMESPACE}}}cr"
+# Run-level breaks render as whitespace, as docx2python did, so markers next
+# to a tab or line break still sit on a word boundary.
+RUN_BREAKS = {TAB_TAG: "\t", BR_TAG: "\n", CR_TAG: "\n"}
+
+_PARSER = etree.XMLParser(collect_ids=False, resolve_entities=False)
+
 DEFAULT_TODO_PATTERNS = [
     r"\bTODO\b",
     r"\bFIXME\b",
@@ -50,6 +64,37 @@ DEFAULT_TODO_PATTERNS = [
 ]
 
 
+def _combine_patterns(patterns: Iterable[str]) -> re.Pattern[str]:
+    unique = dict.fromkeys(patterns)
+    return re.compile("|".join(f"(?:{pattern})" for pattern in unique))
+
+
+DEFAULT_TODO_RE = _combine_patterns(DEFAULT_TODO_PATTERNS)
+# Shortest text any default pattern can match ("TBD", "[?]", ...).
+DEFAULT_MIN_MATCH_LENGTH = 3
+# Every default match contains one of these literals; paragraphs without any
+# of them are skipped before the regex runs.
+DEFAULT_LITERALS = (
+    "[",
+    "TODO",
+    "FIXME",
+    "NTD",
+    "TBD",
+    "TBC",
+    "TBA",
+    "CHECK",
+    "REVIEW",
+    "REVISIT",
+    "CONFIRM",
+    "VERIFY",
+    "INSERT",
+    "DELETE",
+    "REPLACE",
+    "REWORD",
+    "UPDATE",
+)
+
+
 def _base_location(story: str, paragraph_index: int) -> dict:
     return {
         "story": story,
@@ -60,7 +105,7 @@ def _base_location(story: str, paragraph_index: int) -> dict:
 
 def _error_finding(file_index: int, message: str) -> Finding:
     return Finding(
-        id=uuid4().hex[:8],
+        id=new_finding_id(),
         type="todo",
         severity="error",
         location=_base_location("body", 0),
@@ -69,53 +114,91 @@ def _error_finding(file_index: int, message: str) -> Finding:
     )
 
 
-def _flatten(paragraphs: list) -> list[str]:
-    flat: list[str] = []
-
-    def _walk(node):
-        if isinstance(node, str):
-            flat.append(node)
-        elif isinstance(node, list):
-            for child in node:
-                _walk(child)
-
-    _walk(paragraphs)
-    return flat
-
-
-def _compile_patterns(patterns: Iterable[str]) -> list[re.Pattern[str]]:
-    unique = list(dict.fromkeys(patterns))
-    return [re.compile(pattern) for pattern in unique]
-
-
-def collect_todos(
-    file_path: str,
-    file_index: int = 0,
-    *,
-    patterns: Iterable[str] | None = None,
+def _story_parts(package: DocxContext) -> list[tuple[str, str]]:
+    parts = [("body", "word/document.xml")]
+    try:
+        rels_root = etree.fromstring(package.read("word/_rels/document.xml.rels"), _PARSER)
+    except KeyError:
+        return parts
+
+    related: dict[str, list[str]] = {"header": [], "footer": []}
+    for rel in rels_root.iterfind(f"{{{RELATIONSHIP_NAMESPACE}}}Relationship"):
+        story = rel.get("Type", "").rsplit("/", 1)[-1]
+        target = rel.get("Target")
+        if story in related and target:
+            path = target[1:] if target.startswith("/") else f"word/{target}"
+            related[story].append(path)
+
+    for story, paths in related.items():
+        parts.extend((story, path) for path in paths)
+    return parts
+
+
+def _paragraph_text(paragraph: etree._Element) -> str:
+    pieces: list[str] = []
+    for element in paragraph.iter(T_TAG, TAB_TAG, BR_TAG, CR_TAG):
+        if element.tag == T_TAG:
+            pieces.append(element.text or "")
+        elif element.getparent().tag == R_TAG:
+            # w:tab also names tab stops under w:pPr; only run content counts.
+            pieces.append(RUN_BREAKS[element.tag])
+    return "".join(pieces)
+
+
+def _iter_paragraph_text(package: DocxContext, part: str) -> Iterator[str]:
+    with package.open(part) as stream:
+        for _, paragraph in etree.iterparse(
+            stream,
+            events=("end",),
+            tag=P_TAG,
+            collect_ids=False,
+            resolve_entities=False,
+        ):
+            yield _paragraph_text(paragraph)
+            # Drop what has been scanned so memory stays flat on long parts.
+            paragraph.clear(keep_tail=True)
+            while paragraph.getprevious() is not None:
+                del paragraph.getparent()[0]
+
+
+@lru_cache(maxsize=32)
+def _compile_custom_patterns(patterns: tuple[str, ...]) -> tuple[re.Pattern[str], ...]:
+    # Custom patterns are compiled one by one: fusing them would break inline
+    # flags such as "(?i)" and renumber groups used by backreferences.
+    return tuple(re.compile(pattern) for pattern in dict.fromkeys(patterns))
+
+
+def _compile_patterns(patterns: Iterable[str] | None) -> tuple[re.Pattern[str], ...]:
+    if patterns is None:
+        return (DEFAULT_TODO_RE,)
+    return _compile_custom_patterns(tuple(patterns))
+
+
+def _scan_package(
+    package: DocxContext, file_index: int, patterns: Iterable[str] | None
 ) -> list[Finding]:
     findings: list[Finding] = []
-    compiled = _compile_patterns(patterns or DEFAULT_TODO_PATTERNS)
+    compiled = _compile_patterns(patterns or None)
+    min_length = 1 if patterns else DEFAULT_MIN_MATCH_LENGTH
+    literals = () if patterns else DEFAULT_LITERALS
 
     try:
-        content = docx2python(file_path, html=False)
-    except Exception as exc:  # pragma: no cover - defensive
-        return [_error_finding(file_index, f"Failed to open DOCX: {exc}")]
-
-    try:
-        stories = [
-            ("body", _flatten(content.body)),
-            ("header", _flatten(content.header)),
-            ("footer", _flatten(content.footer)),
-        ]
-
-        for story, paragraphs in stories:
-            for para_index, paragraph in enumerate(paragraphs):
+        paragraph_counts: dict[str, int] = {}
+        for story, part in _story_parts(package):
+            if part not in package:
+                continue
+            for paragraph in _iter_paragraph_text(package, part):
+                para_index = paragraph_counts.get(story, 0)
+                paragraph_counts[story] = para_index + 1
+                if len(paragraph) < min_length:
+                    continue
+                if literals and not any(literal in paragraph for literal in literals):
+                    continue
                 for pattern in compiled:
                     for match in pattern.finditer(paragraph):
                         findings.append(
                             Finding(
-                                id=uuid4().hex[:8],
+                                id=new_finding_id(),
                                 type="todo",
                                 severity="warning",
                                 location=_base_location(story, para_index),
@@ -128,41 +211,40 @@ def collect_todos(
                         )
     except Exception as exc:  # pragma: no cover - defensive
         findings.append(_error_finding(file_index, f"Todo scan failed: {exc}"))
-    finally:
-        content.close()
 
     return findings
 
 
-def run_todos(inputs: Iterable[InputSource]) -> dict:
-    generated_at = utc_timestamp()
-    merged_files: List[dict] = []
+def collect_todos(
+    file_path: str | IO[bytes] | DocxContext,
+    file_index: int = 0,
+    *,
+    patterns: Iterable[str] | None = None,
+) -> list[Finding]:
+    if isinstance(file_path, DocxContext):
+        return _scan_package(file_path, file_index, patterns)
 
-    for file_index, source in enumerate(inputs):
-        data = source.handle.read()
-        sha256 = hash_bytes(data)
+    try:
+        package = DocxContext(file_path)
+    except Exception as exc:  # pragma: no cover - defensive
+        return [_error_finding(file_index, f"Failed to open DOCX: {exc}")]
 
-        temp_path: str | None = None
-        if source.is_stdin:
-            with NamedTemporaryFile(delete=False, suffix=".docx") as temp:
-                temp.write(data)
-                temp_path = temp.name
-            target_path = temp_path
-        else:
-            target_path = source.path
+    with package:
+        return _scan_package(package, file_index, patterns)
 
-        findings = collect_todos(target_path, file_index)
 
-        file_entry = {
-            "path": source.display_name,
-            "sha256": sha256,
-            "items": [f.as_dict() for f in findings],
-        }
+def run_todos(inputs: Iterable[InputSource], *, workers: int = 1) -> dict:
+    generated_at = utc_timestamp()
+    merged_files: List[dict] = []
+    calls: list[tuple] = []
 
-        if temp_path:
-            Path(temp_path).unlink(missing_ok=True)
+    for file_index, (source, sha256, target) in enumerate(iter_collector_targets(inputs)):
+        calls.append((target, file_index))
+        merged_files.append({"path": source.display_name, "sha256": sha256})
 
-        merged_files.append(file_entry)
+    results = map_inputs(collect_todos, calls, workers=workers)
+    for file_entry, findings in zip(merged_files, results):
+        file_entry["items"] = [f.as_dict() for f in findings]
 
     return build_envelope(
         tool="lawdocx-todos", files=merged_files, generated_at=generated_at
@@ -2,12 +2,24 @@
 from __future__ import annotations
 
 import hashlib
+import io
+import itertools
 import json
+import mmap
+import os
+import stat
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
-from typing import IO, Iterable
+from typing import IO, Any, Callable, Iterable, Sequence, TypeVar
 
 from lawdocx import __version__
 
+try:  # Optional C encoder; the stdlib fallback produces equivalent JSON.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
 
 def utc_timestamp() -> str:
     """Return an ISO 8601 UTC timestamp suitable for envelopes and logs."""
@@ -15,19 +27,96 @@ def utc_timestamp() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+T = TypeVar("T")
+
+# Seeded once per process so IDs stay random-looking without a urandom call per finding.
+_FINDING_IDS = itertools.count(int.from_bytes(os.urandom(4), "big"))
+
+
+def _reseed_finding_ids() -> None:
+    # Forked workers inherit the parent's counter; give each its own start.
+    global _FINDING_IDS
+    _FINDING_IDS = itertools.count(int.from_bytes(os.urandom(4), "big"))
+
+
+def new_finding_id() -> str:
+    """Return an 8-character hex finding identifier, unique within the process."""
+
+    return f"{next(_FINDING_IDS) & 0xFFFFFFFF:08x}"
+
+
+def map_inputs(
+    collector: Callable[..., T], calls: Sequence[tuple[Any, ...]], *, workers: int = 1
+) -> list[T]:
+    """Apply ``collector`` to each argument tuple, in input order.
+
+    Calls run in-process unless ``workers`` is above one and there is more than
+    one call, in which case up to ``workers`` processes are used. If a pool
+    cannot be started (for example inside a daemonic worker), the calls run
+    in-process instead.
+    """
+
+    if workers <= 1 or len(calls) < 2:
+        return [collector(*args) for args in calls]
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(calls)), initializer=_reseed_finding_ids
+        ) as executor:
+            return list(executor.map(collector, *zip(*calls)))
+    except (OSError, AssertionError, NotImplementedError, BrokenProcessPool):
+        return [collector(*args) for args in calls]
+
+
 def hash_bytes(data: bytes) -> str:
     """Return the SHA-256 hex digest for a bytes payload."""
 
     return hashlib.sha256(data).hexdigest()
 
 
-def hash_file(path: str, *, chunk_size: int = 8192) -> str:
+# Files larger than this are hashed through a read-only memory map.
+MMAP_THRESHOLD = 1 << 20
+
+
+def hash_file(path: str, *, chunk_size: int = 1 << 20) -> str:
     """Return the SHA-256 hex digest for a file without loading it entirely into memory."""
 
+    # Unbuffered: reads are already large, so BufferedReader would only add a copy.
+    with open(path, "rb", buffering=0) as handle:
+        return hash_stream(handle, chunk_size=chunk_size)
+
+
+def hash_stream(handle: IO[bytes], *, chunk_size: int = 1 << 20) -> str:
+    """Return the SHA-256 hex digest of the remaining bytes of a binary stream."""
+
     sha = hashlib.sha256()
-    with open(path, "rb") as handle:
-        for chunk in iter(lambda: handle.read(chunk_size), b""):
-            sha.update(chunk)
+    try:
+        fileno = handle.fileno()
+    except (AttributeError, OSError):
+        fileno = None
+
+    # Pipes and special files report no useful size, so only regular files
+    # get the memory map or a buffer sized to the file.
+    status = os.fstat(fileno) if fileno is not None else None
+    if status is not None and stat.S_ISREG(status.st_mode):
+        file_size = status.st_size
+        if file_size > MMAP_THRESHOLD and handle.tell() == 0:
+            with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                sha.update(mapped)
+            return sha.hexdigest()
+        # Sized to the file so small inputs stay small.
+        chunk_size = max(1, min(chunk_size, file_size))
+
+    # One reusable buffer for every read.
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    while True:
+        size = handle.readinto(buffer)
+        if not size:
+            break
+        sha.update(view[:size])
     return sha.hexdigest()
 
 
@@ -42,30 +131,83 @@ def build_envelope(*, tool: str, files: Iterable[dict], generated_at: str | None
     }
 
 
+def _json_line(data: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    # json.dumps takes the one-shot C encoder path; json.dump would walk the
+    # pure-Python iterencode and issue a write per fragment.
+    return (json.dumps(data) + "\n").encode("utf-8")
+
+
+def _byte_sink(output_handle: IO) -> IO | None:
+    if isinstance(output_handle, (io.RawIOBase, io.BufferedIOBase)):
+        return output_handle
+    buffer = getattr(output_handle, "buffer", None)
+    if buffer is not None:
+        # Flush pending text so the bytes land after it.
+        output_handle.flush()
+    return buffer
+
+
 def dump_json_line(data: dict, output_handle: IO) -> None:
-    """Serialize a dictionary as JSON followed by a newline to support streaming outputs."""
+    """Serialize a dictionary as JSON followed by a newline to support streaming outputs.
+
+    Output is UTF-8. It is written to the underlying byte buffer when the handle
+    has one, so the console encoding never matters; handles without a buffer
+    (such as ``io.StringIO``) receive the decoded text. With the ``speedups``
+    extra, orjson emits compact JSON with non-ASCII characters unescaped; the
+    stdlib fallback keeps ``json.dumps`` defaults. Both parse to the same data.
+    """
 
-    json.dump(data, output_handle)
-    output_handle.write("\n")
+    line = _json_line(data)
+    sink = _byte_sink(output_handle)
+    if sink is None:
+        output_handle.write(line.decode("utf-8"))
+    else:
+        sink.write(line)
 
 
 SEVERITY_ORDER = {"info": 0, "warning": 1, "error": 2}
+# Severities passing each threshold, precomputed so filtering is one set lookup.
+ALLOWED_SEVERITIES = {
+    minimum: frozenset(severity for severity, rank in SEVERITY_ORDER.items() if rank >= threshold)
+    for minimum, threshold in SEVERITY_ORDER.items()
+}
 
 
-def filter_files_by_severity(files: Iterable[dict], minimum: str) -> list[dict]:
-    """Return file entries containing only findings at or above ``minimum`` severity."""
+def filter_and_summarize(
+    files: Iterable[dict], minimum: str
+) -> tuple[list[dict], dict[str, int]]:
+    """Filter file entries by ``minimum`` severity and count the findings kept.
 
-    threshold = SEVERITY_ORDER[minimum]
+    Equivalent to :func:`filter_files_by_severity` followed by
+    :func:`summarize_severities`, in a single pass over the findings.
+    """
+
+    # Everything (including unknown severities) ranks at or above "info".
+    keep_all = SEVERITY_ORDER[minimum] == 0
+    allowed = ALLOWED_SEVERITIES[minimum]
+    totals = {"info": 0, "warning": 0, "error": 0}
     filtered: list[dict] = []
 
     for entry in files:
-        items = [
-            item
-            for item in entry.get("items", [])
-            if SEVERITY_ORDER.get(item.get("severity", "info"), 0) >= threshold
-        ]
-        filtered.append({**entry, "items": items})
+        items: list[dict] = []
+        for item in entry.get("items", []):
+            severity = item.get("severity", "info")
+            if not keep_all and severity not in allowed:
+                continue
+            items.append(item)
+            if severity in totals:
+                totals[severity] += 1
+        filtered.append(dict(entry, items=items))
+
+    return filtered, totals
+
+
+def filter_files_by_severity(files: Iterable[dict], minimum: str) -> list[dict]:
+    """Return file entries containing only findings at or above ``minimum`` severity."""
 
+    filtered, _ = filter_and_summarize(files, minimum)
     return filtered
 
 
@@ -100,8 +242,24 @@ def text_context(
         Maximum number of characters to include from the target span itself.
     """
 
+    # Clamp the target before slicing so a long span is not copied twice.
     return {
         "before": text[max(0, start - window) : start],
-        "target": text[start:end][:target_limit],
+        "target": text[start : min(end, start + target_limit)],
         "after": text[end : end + window],
     }
+
+
+def text_contexts(
+    text: str,
+    spans: Sequence[tuple[int, int]],
+    *,
+    window: int = 100,
+    target_limit: int = 500,
+) -> list[dict]:
+    """Return :func:`text_context` dictionaries for several spans of the same text."""
+
+    return [
+        text_context(text, start, end, window=window, target_limit=target_limit)
+        for start, end in spans
+    ]
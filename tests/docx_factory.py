@@ -1,10 +1,12 @@
 """Helpers for building DOCX fixtures on the fly without storing binaries."""
 from __future__ import annotations
 
+import io
 import textwrap
 import zipfile
+from functools import lru_cache
 from pathlib import Path
-from xml.sax.saxutils import escape
+from typing import Iterable
 
 WORD_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
 RELATIONSHIP_NAMESPACE = (
@@ -52,18 +54,38 @@ CUSTOM_XML = textwrap.dedent(
 ).strip()
 
 
-def _wrap_paragraphs(paragraphs: list[str]) -> str:
-    xml_paragraphs = []
-    for text in paragraphs:
-        escaped = escape(text)
-        xml_paragraphs.append(
-            textwrap.dedent(
-                f"""
-                <w:p xmlns:w=\"{WORD_NAMESPACE}\">\n      <w:r><w:t>{escaped}</w:t></w:r>\n    </w:p>
-                """
-            ).strip()
-        )
-    return "\n".join(xml_paragraphs)
+PARAGRAPH_TEMPLATE = (
+    f'<w:p xmlns:w="{WORD_NAMESPACE}">\n  <w:r><w:t>{{}}</w:t></w:r>\n</w:p>'
+)
+
+
+_XML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
+def _escape(text: str) -> str:
+    # Most fixture text is plain ASCII prose; skip the translate pass entirely.
+    if "&" in text or "<" in text or ">" in text:
+        return text.translate(_XML_ESCAPE_TABLE)
+    return text
+
+
+BOILERPLATE_DOCUMENT_PROLOG = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{WORD_NAMESPACE}" xmlns:r="{RELATIONSHIP_NAMESPACE}">
+  <w:body>"""
+
+BOILERPLATE_DOCUMENT_EPILOG = """    <w:sectPr>
+      <w:headerReference w:type="default" r:id="rId1"/>
+      <w:footerReference w:type="default" r:id="rId2"/>
+    </w:sectPr>
+  </w:body>
+</w:document>"""
+
+
+def _boilerplate_document(paragraphs: Iterable[str]) -> str:
+    parts = [BOILERPLATE_DOCUMENT_PROLOG]
+    parts.extend(PARAGRAPH_TEMPLATE.format(_escape(text)) for text in paragraphs)
+    parts.append(BOILERPLATE_DOCUMENT_EPILOG)
+    return "\n".join(parts)
 
 
 DOCUMENT_XML = textwrap.dedent(
@@ -100,6 +122,9 @@ FOOTER_XML = textwrap.dedent(
     """
 ).strip()
 
+_HEADER_PRE, _HEADER_POST = HEADER_XML.split("{header_text}")
+_FOOTER_PRE, _FOOTER_POST = FOOTER_XML.split("{footer_text}")
+
 
 EMPTY_RELS_XML = (
     "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>\n"
@@ -235,140 +260,172 @@ DOCUMENT_RELS_WITH_CHANGES = textwrap.dedent(
 ).strip()
 
 
-def _content_types_xml(include_custom: bool) -> str:
-    overrides = [
-        "  <Override PartName=\"/word/document.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml\"/>",
-        "  <Override PartName=\"/docProps/core.xml\" ContentType=\"application/vnd.openxmlformats-package.core-properties+xml\"/>",
-        "  <Override PartName=\"/docProps/app.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.extended-properties+xml\"/>",
-    ]
-    if include_custom:
-        overrides.append(
-            "  <Override PartName=\"/docProps/custom.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.custom-properties+xml\"/>"
-        )
-
-    override_str = "\n".join(overrides)
-    return textwrap.dedent(
-        f"""
-        <?xml version="1.0" encoding="UTF-8"?>
-        <Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
-          <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
-          <Default Extension="xml" ContentType="application/xml"/>
-        {override_str}
-        </Types>
-        """
-    ).strip()
+CONTENT_TYPES_TEMPLATE = textwrap.dedent(
+    """
+    <?xml version="1.0" encoding="UTF-8"?>
+    <Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+      <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+      <Default Extension="xml" ContentType="application/xml"/>
+    {override_str}
+    </Types>
+    """
+).strip()
 
+DOCUMENT_OVERRIDE = "  <Override PartName=\"/word/document.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml\"/>"
+CORE_OVERRIDE = "  <Override PartName=\"/docProps/core.xml\" ContentType=\"application/vnd.openxmlformats-package.core-properties+xml\"/>"
+APP_OVERRIDE = "  <Override PartName=\"/docProps/app.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.extended-properties+xml\"/>"
+CUSTOM_OVERRIDE = "  <Override PartName=\"/docProps/custom.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.custom-properties+xml\"/>"
+HEADER_OVERRIDE = "  <Override PartName=\"/word/header1.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.wordprocessingml.header+xml\"/>"
+FOOTER_OVERRIDE = "  <Override PartName=\"/word/footer1.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.wordprocessingml.footer+xml\"/>"
+FOOTNOTES_OVERRIDE = "  <Override PartName=\"/word/footnotes.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.wordprocessingml.footnotes+xml\"/>"
+ENDNOTES_OVERRIDE = "  <Override PartName=\"/word/endnotes.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.wordprocessingml.endnotes+xml\"/>"
+COMMENTS_OVERRIDE = "  <Override PartName=\"/word/comments.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.wordprocessingml.comments+xml\"/>"
+COMMENTS_EXTENDED_OVERRIDE = "  <Override PartName=\"/word/commentsExtended.xml\" ContentType=\"application/vnd.ms-word.commentsExtended+xml\"/>"
 
-def _content_types_with_header_footer(paragraphs: list[str]) -> str:
-    overrides = [
-        "  <Override PartName=\"/word/document.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml\"/>",
-        "  <Override PartName=\"/word/header1.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.wordprocessingml.header+xml\"/>",
-        "  <Override PartName=\"/word/footer1.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.wordprocessingml.footer+xml\"/>",
-    ]
-    return textwrap.dedent(
-        """
-        <?xml version="1.0" encoding="UTF-8"?>
-        <Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
-          <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
-          <Default Extension="xml" ContentType="application/xml"/>
-        {override_str}
-        </Types>
-        """
-    ).strip().format(override_str="\n".join(overrides))
 
+# Fixtures are read back immediately, so parts are stored rather than deflated.
+FIXTURE_COMPRESSION = zipfile.ZIP_STORED
 
-def _content_types_with_notes() -> str:
-    overrides = [
-        "  <Override PartName=\"/word/document.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml\"/>",
-        "  <Override PartName=\"/word/footnotes.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.wordprocessingml.footnotes+xml\"/>",
-        "  <Override PartName=\"/word/endnotes.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.wordprocessingml.endnotes+xml\"/>",
-    ]
-    return textwrap.dedent(
-        """
-        <?xml version="1.0" encoding="UTF-8"?>
-        <Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
-          <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
-          <Default Extension="xml" ContentType="application/xml"/>
-        {override_str}
-        </Types>
-        """
-    ).strip().format(override_str="\n".join(overrides))
+# A fixed timestamp keeps fixture bytes identical from run to run and spares
+# ZipInfo a time.localtime() call per part.
+FIXTURE_DATE_TIME = (1980, 1, 1, 0, 0, 0)
 
 
-def _content_types_for_changes() -> str:
-    overrides = [
-        "  <Override PartName=\"/word/document.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml\"/>",
-        "  <Override PartName=\"/word/header1.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.wordprocessingml.header+xml\"/>",
-        "  <Override PartName=\"/word/footer1.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.wordprocessingml.footer+xml\"/>",
-        "  <Override PartName=\"/word/footnotes.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.wordprocessingml.footnotes+xml\"/>",
-        "  <Override PartName=\"/word/endnotes.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.wordprocessingml.endnotes+xml\"/>",
-    ]
+def _entry(name: str) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(name, date_time=FIXTURE_DATE_TIME)
+    info.compress_type = FIXTURE_COMPRESSION
+    info.external_attr = 0o600 << 16
+    return info
 
-    return textwrap.dedent(
-        """
-        <?xml version="1.0" encoding="UTF-8"?>
-        <Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
-          <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
-          <Default Extension="xml" ContentType="application/xml"/>
-        {override_str}
-        </Types>
-        """
-    ).strip().format(override_str="\n".join(overrides))
 
+def _content_types(*overrides: str) -> bytes:
+    return CONTENT_TYPES_TEMPLATE.format(override_str="\n".join(overrides)).encode("utf-8")
 
-def _content_types_with_comments() -> str:
-    overrides = [
-        "  <Override PartName=\"/word/document.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml\"/>",
-        "  <Override PartName=\"/word/comments.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.wordprocessingml.comments+xml\"/>",
-        "  <Override PartName=\"/word/commentsExtended.xml\" ContentType=\"application/vnd.ms-word.commentsExtended+xml\"/>",
-    ]
 
-    return textwrap.dedent(
-        """
-        <?xml version="1.0" encoding="UTF-8"?>
-        <Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
-          <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
-          <Default Extension="xml" ContentType="application/xml"/>
-        {override_str}
-        </Types>
-        """
-    ).strip().format(override_str="\n".join(overrides))
+# Every content-types part is static, so each variant is rendered and encoded once.
+CONTENT_TYPES_METADATA = {
+    False: _content_types(DOCUMENT_OVERRIDE, CORE_OVERRIDE, APP_OVERRIDE),
+    True: _content_types(DOCUMENT_OVERRIDE, CORE_OVERRIDE, APP_OVERRIDE, CUSTOM_OVERRIDE),
+}
+CONTENT_TYPES_HEADER_FOOTER = _content_types(DOCUMENT_OVERRIDE, HEADER_OVERRIDE, FOOTER_OVERRIDE)
+CONTENT_TYPES_NOTES = _content_types(DOCUMENT_OVERRIDE, FOOTNOTES_OVERRIDE, ENDNOTES_OVERRIDE)
+CONTENT_TYPES_CHANGES = _content_types(
+    DOCUMENT_OVERRIDE, HEADER_OVERRIDE, FOOTER_OVERRIDE, FOOTNOTES_OVERRIDE, ENDNOTES_OVERRIDE
+)
+CONTENT_TYPES_COMMENTS = _content_types(
+    DOCUMENT_OVERRIDE, COMMENTS_OVERRIDE, COMMENTS_EXTENDED_OVERRIDE
+)
+CONTENT_TYPES_DOCUMENT = _content_types(DOCUMENT_OVERRIDE)
 
 
-def create_metadata_docx(
-    base_dir: Path,
-    name: str,
+@lru_cache(maxsize=None)
+def build_metadata_docx(
     *,
     include_custom: bool = True,
     include_custom_xml: bool = True,
-) -> Path:
-    """Create a minimal DOCX file with known metadata.
+) -> bytes:
+    """Return the bytes of a minimal DOCX package with known metadata.
 
     The DOCX is built from plain XML parts to avoid committing binary fixtures.
+    Parts are stored uncompressed; deflating a few kilobytes only costs time.
+    Every part is constant, so each of the four variants is built once and cached.
     """
 
-    path = base_dir / name
     relationships = RELATIONSHIPS_XML if include_custom else RELATIONSHIPS_XML_NO_CUSTOM
     document_relationships = (
         DOCUMENT_RELS_WITH_CUSTOM_XML if include_custom_xml else EMPTY_RELS_XML
     )
 
-    with zipfile.ZipFile(path, "w") as zf:
-        zf.writestr("[Content_Types].xml", _content_types_xml(include_custom))
-        zf.writestr("_rels/.rels", relationships)
-        zf.writestr("docProps/core.xml", CORE_XML)
-        zf.writestr("docProps/app.xml", APP_XML)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(
+        buffer, "w", compression=FIXTURE_COMPRESSION, allowZip64=False
+    ) as zf:
+        zf.writestr(_entry("[Content_Types].xml"), CONTENT_TYPES_METADATA[include_custom])
+        zf.writestr(_entry("_rels/.rels"), relationships)
+        zf.writestr(_entry("docProps/core.xml"), CORE_XML)
+        zf.writestr(_entry("docProps/app.xml"), APP_XML)
         if include_custom:
-            zf.writestr("docProps/custom.xml", CUSTOM_XML)
-        zf.writestr("word/document.xml", DOCUMENT_XML)
-        zf.writestr("word/_rels/document.xml.rels", document_relationships)
+            zf.writestr(_entry("docProps/custom.xml"), CUSTOM_XML)
+        zf.writestr(_entry("word/document.xml"), DOCUMENT_XML)
+        zf.writestr(_entry("word/_rels/document.xml.rels"), document_relationships)
         if include_custom_xml:
-            zf.writestr("customXml/item1.xml", CUSTOM_XML_ITEM_ONE)
-            zf.writestr("customXml/item2.xml", CUSTOM_XML_ITEM_TWO)
+            zf.writestr(_entry("customXml/item1.xml"), CUSTOM_XML_ITEM_ONE)
+            zf.writestr(_entry("customXml/item2.xml"), CUSTOM_XML_ITEM_TWO)
+
+    return buffer.getvalue()
+
 
+def create_metadata_docx(
+    base_dir: Path,
+    name: str,
+    *,
+    include_custom: bool = True,
+    include_custom_xml: bool = True,
+) -> Path:
+    """Write :func:`build_metadata_docx` output to ``base_dir / name``."""
+
+    path = base_dir / name
+    path.write_bytes(
+        build_metadata_docx(
+            include_custom=include_custom, include_custom_xml=include_custom_xml
+        )
+    )
     return path
 
 
+def build_boilerplate_docx(
+    *,
+    header_text: str = "",
+    footer_text: str = "",
+    body_paragraphs: list[str] | None = None,
+) -> bytes:
+    """Return the bytes of a DOCX package with controllable header/footer/body content."""
+
+    return _build_boilerplate_docx(
+        header_text, footer_text, tuple(body_paragraphs or ["Hello"])
+    )
+
+
+# Bodies above this size (stress tests with long paragraph lists) are deflated
+# at the fastest level; every other part is small enough to store as-is.
+DEFLATE_THRESHOLD = 4096
+
+
+def _body_compression(document_body: str) -> int:
+    if len(document_body) > DEFLATE_THRESHOLD:
+        return zipfile.ZIP_DEFLATED
+    return FIXTURE_COMPRESSION
+
+
+@lru_cache(maxsize=32)
+def _build_boilerplate_docx(
+    header_text: str, footer_text: str, body_paragraphs: tuple[str, ...]
+) -> bytes:
+    document_body = _boilerplate_document(body_paragraphs)
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(
+        buffer, "w", compression=FIXTURE_COMPRESSION, allowZip64=False
+    ) as zf:
+        zf.writestr(_entry("[Content_Types].xml"), CONTENT_TYPES_HEADER_FOOTER)
+        zf.writestr(_entry("_rels/.rels"), RELATIONSHIPS_WITH_DOCUMENT)
+        zf.writestr(
+            _entry("word/document.xml"),
+            document_body,
+            compress_type=_body_compression(document_body),
+            compresslevel=1,
+        )
+        zf.writestr(_entry("word/_rels/document.xml.rels"), DOCUMENT_RELS_WITH_HEADER_FOOTER)
+        zf.writestr(
+            _entry("word/header1.xml"), f"{_HEADER_PRE}{_escape(header_text)}{_HEADER_POST}"
+        )
+        zf.writestr(
+            _entry("word/footer1.xml"), f"{_FOOTER_PRE}{_escape(footer_text)}{_FOOTER_POST}"
+        )
+
+    return buffer.getvalue()
+
+
 def create_boilerplate_docx(
     base_dir: Path,
     name: str,
@@ -379,39 +436,20 @@ def create_boilerplate_docx(
 ) -> Path:
     """Create a DOCX file with controllable header/footer/body content."""
 
-    body_paragraphs = body_paragraphs or ["Hello"]
     path = base_dir / name
-
-    document_body = textwrap.dedent(
-        f"""
-        <?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-        <w:document xmlns:w="{WORD_NAMESPACE}" xmlns:r="{RELATIONSHIP_NAMESPACE}">
-          <w:body>
-        {_wrap_paragraphs(body_paragraphs)}
-            <w:sectPr>
-              <w:headerReference w:type="default" r:id="rId1"/>
-              <w:footerReference w:type="default" r:id="rId2"/>
-            </w:sectPr>
-          </w:body>
-        </w:document>
-        """
-    ).strip()
-
-    with zipfile.ZipFile(path, "w") as zf:
-        zf.writestr("[Content_Types].xml", _content_types_with_header_footer(body_paragraphs))
-        zf.writestr("_rels/.rels", RELATIONSHIPS_WITH_DOCUMENT)
-        zf.writestr("word/document.xml", document_body)
-        zf.writestr("word/_rels/document.xml.rels", DOCUMENT_RELS_WITH_HEADER_FOOTER)
-        zf.writestr("word/header1.xml", HEADER_XML.format(header_text=escape(header_text)))
-        zf.writestr("word/footer1.xml", FOOTER_XML.format(footer_text=escape(footer_text)))
-
+    path.write_bytes(
+        build_boilerplate_docx(
+            header_text=header_text,
+            footer_text=footer_text,
+            body_paragraphs=body_paragraphs,
+        )
+    )
     return path
 
 
-def create_outline_docx(base_dir: Path, name: str) -> Path:
-    """Create a DOCX file with paragraphs exercising numbering detection."""
-
-    path = base_dir / name
+@lru_cache(maxsize=None)
+def build_outline_docx() -> bytes:
+    """Return the bytes of a DOCX package with paragraphs exercising numbering detection."""
 
     document_body = textwrap.dedent(
         f"""
@@ -445,26 +483,78 @@ def create_outline_docx(base_dir: Path, name: str) -> Path:
         """
     ).strip()
 
-    with zipfile.ZipFile(path, "w") as zf:
-        zf.writestr("[Content_Types].xml", CONTENT_TYPES_WITH_STYLES)
-        zf.writestr("_rels/.rels", RELATIONSHIPS_WITH_DOCUMENT)
-        zf.writestr("word/document.xml", document_body)
-        zf.writestr("word/styles.xml", STYLES_XML)
-        zf.writestr("word/_rels/document.xml.rels", EMPTY_RELS_XML)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(
+        buffer, "w", compression=FIXTURE_COMPRESSION, allowZip64=False
+    ) as zf:
+        zf.writestr(_entry("[Content_Types].xml"), CONTENT_TYPES_WITH_STYLES)
+        zf.writestr(_entry("_rels/.rels"), RELATIONSHIPS_WITH_DOCUMENT)
+        zf.writestr(_entry("word/document.xml"), document_body)
+        zf.writestr(_entry("word/styles.xml"), STYLES_XML)
+        zf.writestr(_entry("word/_rels/document.xml.rels"), EMPTY_RELS_XML)
+
+    return buffer.getvalue()
 
+
+def create_outline_docx(base_dir: Path, name: str) -> Path:
+    """Write :func:`build_outline_docx` output to ``base_dir / name``."""
+
+    path = base_dir / name
+    path.write_bytes(build_outline_docx())
     return path
 
 
-def create_notes_docx(
-    base_dir: Path,
-    name: str,
+@lru_cache(maxsize=None)
+def build_run_breaks_docx() -> bytes:
+    """Return the bytes of a DOCX package whose markers sit next to tabs and breaks."""
+
+    document_body = textwrap.dedent(
+        f"""
+        <?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+        <w:document xmlns:w="{WORD_NAMESPACE}" xmlns:r="{RELATIONSHIP_NAMESPACE}">
+          <w:body>
+            <w:p>
+              <w:pPr><w:tabs><w:tab w:val="left" w:pos="720"/></w:tabs></w:pPr>
+              <w:r><w:t>Intro TODO</w:t><w:tab/><w:t>after tab</w:t></w:r>
+            </w:p>
+            <w:p>
+              <w:r><w:t>First line</w:t><w:br/><w:t>TBD on the next</w:t></w:r>
+            </w:p>
+            <w:p>
+              <w:r><w:t>Carriage</w:t><w:cr/><w:t>CHECK return</w:t></w:r>
+            </w:p>
+          </w:body>
+        </w:document>
+        """
+    ).strip()
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(
+        buffer, "w", compression=FIXTURE_COMPRESSION, allowZip64=False
+    ) as zf:
+        zf.writestr(_entry("[Content_Types].xml"), CONTENT_TYPES_DOCUMENT)
+        zf.writestr(_entry("_rels/.rels"), RELATIONSHIPS_WITH_DOCUMENT)
+        zf.writestr(_entry("word/document.xml"), document_body)
+        zf.writestr(_entry("word/_rels/document.xml.rels"), EMPTY_RELS_XML)
+
+    return buffer.getvalue()
+
+
+def create_run_breaks_docx(base_dir: Path, name: str) -> Path:
+    """Write :func:`build_run_breaks_docx` output to ``base_dir / name``."""
+
+    path = base_dir / name
+    path.write_bytes(build_run_breaks_docx())
+    return path
+
+
+@lru_cache(maxsize=32)
+def build_notes_docx(
     *,
     footnote_text: str = "Footnote text",
     endnote_text: str = "Endnote text",
-) -> Path:
-    """Create a DOCX file containing a footnote and endnote reference."""
-
-    path = base_dir / name
+) -> bytes:
+    """Return the bytes of a DOCX package containing a footnote and endnote reference."""
 
     document_body = textwrap.dedent(
         f"""
@@ -491,7 +581,7 @@ def create_notes_docx(
         <w:footnotes xmlns:w="{WORD_NAMESPACE}">
           <w:footnote w:id="-1"><w:p><w:r><w:separator/></w:r></w:p></w:footnote>
           <w:footnote w:id="0"><w:p><w:r><w:continuationSeparator/></w:r></w:p></w:footnote>
-          <w:footnote w:id="1"><w:p><w:r><w:t>{escape(footnote_text)}</w:t></w:r></w:p></w:footnote>
+          <w:footnote w:id="1"><w:p><w:r><w:t>{_escape(footnote_text)}</w:t></w:r></w:p></w:footnote>
         </w:footnotes>
         """
     ).strip()
@@ -501,26 +591,44 @@ def create_notes_docx(
         <?xml version="1.0" encoding="UTF-8" standalone="yes"?>
         <w:endnotes xmlns:w="{WORD_NAMESPACE}">
           <w:endnote w:id="0"><w:p><w:r><w:separator/></w:r></w:p></w:endnote>
-          <w:endnote w:id="2"><w:p><w:r><w:t>{escape(endnote_text)}</w:t></w:r></w:p></w:endnote>
+          <w:endnote w:id="2"><w:p><w:r><w:t>{_escape(endnote_text)}</w:t></w:r></w:p></w:endnote>
         </w:endnotes>
         """
     ).strip()
 
-    with zipfile.ZipFile(path, "w") as zf:
-        zf.writestr("[Content_Types].xml", _content_types_with_notes())
-        zf.writestr("_rels/.rels", RELATIONSHIPS_WITH_DOCUMENT)
-        zf.writestr("word/document.xml", document_body)
-        zf.writestr("word/_rels/document.xml.rels", DOCUMENT_RELS_WITH_NOTES)
-        zf.writestr("word/footnotes.xml", footnotes_xml)
-        zf.writestr("word/endnotes.xml", endnotes_xml)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(
+        buffer, "w", compression=FIXTURE_COMPRESSION, allowZip64=False
+    ) as zf:
+        zf.writestr(_entry("[Content_Types].xml"), CONTENT_TYPES_NOTES)
+        zf.writestr(_entry("_rels/.rels"), RELATIONSHIPS_WITH_DOCUMENT)
+        zf.writestr(_entry("word/document.xml"), document_body)
+        zf.writestr(_entry("word/_rels/document.xml.rels"), DOCUMENT_RELS_WITH_NOTES)
+        zf.writestr(_entry("word/footnotes.xml"), footnotes_xml)
+        zf.writestr(_entry("word/endnotes.xml"), endnotes_xml)
 
-    return path
+    return buffer.getvalue()
 
 
-def create_multistory_notes_docx(base_dir: Path, name: str) -> Path:
-    """Create a DOCX file with note references in multiple stories."""
+def create_notes_docx(
+    base_dir: Path,
+    name: str,
+    *,
+    footnote_text: str = "Footnote text",
+    endnote_text: str = "Endnote text",
+) -> Path:
+    """Write :func:`build_notes_docx` output to ``base_dir / name``."""
 
     path = base_dir / name
+    path.write_bytes(
+        build_notes_docx(footnote_text=footnote_text, endnote_text=endnote_text)
+    )
+    return path
+
+
+@lru_cache(maxsize=None)
+def build_multistory_notes_docx() -> bytes:
+    """Return the bytes of a DOCX package with note references in multiple stories."""
 
     document_body = textwrap.dedent(
         f"""
@@ -590,23 +698,33 @@ def create_multistory_notes_docx(base_dir: Path, name: str) -> Path:
         """
     ).strip()
 
-    with zipfile.ZipFile(path, "w") as zf:
-        zf.writestr("[Content_Types].xml", _content_types_for_changes())
-        zf.writestr("_rels/.rels", RELATIONSHIPS_WITH_DOCUMENT)
-        zf.writestr("word/document.xml", document_body)
-        zf.writestr("word/header1.xml", header_xml)
-        zf.writestr("word/footer1.xml", footer_xml)
-        zf.writestr("word/_rels/document.xml.rels", DOCUMENT_RELS_WITH_CHANGES)
-        zf.writestr("word/footnotes.xml", footnotes_xml)
-        zf.writestr("word/endnotes.xml", endnotes_xml)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(
+        buffer, "w", compression=FIXTURE_COMPRESSION, allowZip64=False
+    ) as zf:
+        zf.writestr(_entry("[Content_Types].xml"), CONTENT_TYPES_CHANGES)
+        zf.writestr(_entry("_rels/.rels"), RELATIONSHIPS_WITH_DOCUMENT)
+        zf.writestr(_entry("word/document.xml"), document_body)
+        zf.writestr(_entry("word/header1.xml"), header_xml)
+        zf.writestr(_entry("word/footer1.xml"), footer_xml)
+        zf.writestr(_entry("word/_rels/document.xml.rels"), DOCUMENT_RELS_WITH_CHANGES)
+        zf.writestr(_entry("word/footnotes.xml"), footnotes_xml)
+        zf.writestr(_entry("word/endnotes.xml"), endnotes_xml)
 
-    return path
+    return buffer.getvalue()
 
 
-def create_comments_docx(base_dir: Path, name: str) -> Path:
-    """Create a DOCX file containing threaded/resolved comments."""
+def create_multistory_notes_docx(base_dir: Path, name: str) -> Path:
+    """Write :func:`build_multistory_notes_docx` output to ``base_dir / name``."""
 
     path = base_dir / name
+    path.write_bytes(build_multistory_notes_docx())
+    return path
+
+
+@lru_cache(maxsize=None)
+def build_comments_docx() -> bytes:
+    """Return the bytes of a DOCX package containing threaded/resolved comments."""
 
     document_body = textwrap.dedent(
         f"""
@@ -658,21 +776,31 @@ def create_comments_docx(base_dir: Path, name: str) -> Path:
         """
     ).strip()
 
-    with zipfile.ZipFile(path, "w") as zf:
-        zf.writestr("[Content_Types].xml", _content_types_with_comments())
-        zf.writestr("_rels/.rels", RELATIONSHIPS_WITH_DOCUMENT)
-        zf.writestr("word/document.xml", document_body)
-        zf.writestr("word/_rels/document.xml.rels", EMPTY_RELS_XML)
-        zf.writestr("word/comments.xml", comments_xml)
-        zf.writestr("word/commentsExtended.xml", comments_extended_xml)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(
+        buffer, "w", compression=FIXTURE_COMPRESSION, allowZip64=False
+    ) as zf:
+        zf.writestr(_entry("[Content_Types].xml"), CONTENT_TYPES_COMMENTS)
+        zf.writestr(_entry("_rels/.rels"), RELATIONSHIPS_WITH_DOCUMENT)
+        zf.writestr(_entry("word/document.xml"), document_body)
+        zf.writestr(_entry("word/_rels/document.xml.rels"), EMPTY_RELS_XML)
+        zf.writestr(_entry("word/comments.xml"), comments_xml)
+        zf.writestr(_entry("word/commentsExtended.xml"), comments_extended_xml)
 
-    return path
+    return buffer.getvalue()
 
 
-def create_changes_docx(base_dir: Path, name: str) -> Path:
-    """Create a DOCX file containing tracked changes across stories."""
+def create_comments_docx(base_dir: Path, name: str) -> Path:
+    """Write :func:`build_comments_docx` output to ``base_dir / name``."""
 
     path = base_dir / name
+    path.write_bytes(build_comments_docx())
+    return path
+
+
+@lru_cache(maxsize=None)
+def build_changes_docx() -> bytes:
+    """Return the bytes of a DOCX package containing tracked changes across stories."""
 
     document_body = textwrap.dedent(
         f"""
@@ -740,23 +868,33 @@ def create_changes_docx(base_dir: Path, name: str) -> Path:
         """
     ).strip()
 
-    with zipfile.ZipFile(path, "w") as zf:
-        zf.writestr("[Content_Types].xml", _content_types_for_changes())
-        zf.writestr("_rels/.rels", RELATIONSHIPS_WITH_DOCUMENT)
-        zf.writestr("word/document.xml", document_body)
-        zf.writestr("word/_rels/document.xml.rels", DOCUMENT_RELS_WITH_CHANGES)
-        zf.writestr("word/header1.xml", header_xml)
-        zf.writestr("word/footer1.xml", footer_xml)
-        zf.writestr("word/footnotes.xml", footnotes_xml)
-        zf.writestr("word/endnotes.xml", endnotes_xml)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(
+        buffer, "w", compression=FIXTURE_COMPRESSION, allowZip64=False
+    ) as zf:
+        zf.writestr(_entry("[Content_Types].xml"), CONTENT_TYPES_CHANGES)
+        zf.writestr(_entry("_rels/.rels"), RELATIONSHIPS_WITH_DOCUMENT)
+        zf.writestr(_entry("word/document.xml"), document_body)
+        zf.writestr(_entry("word/_rels/document.xml.rels"), DOCUMENT_RELS_WITH_CHANGES)
+        zf.writestr(_entry("word/header1.xml"), header_xml)
+        zf.writestr(_entry("word/footer1.xml"), footer_xml)
+        zf.writestr(_entry("word/footnotes.xml"), footnotes_xml)
+        zf.writestr(_entry("word/endnotes.xml"), endnotes_xml)
 
-    return path
+    return buffer.getvalue()
 
 
-def create_highlights_docx(base_dir: Path, name: str) -> Path:
-    """Create a DOCX file containing highlighted text across stories."""
+def create_changes_docx(base_dir: Path, name: str) -> Path:
+    """Write :func:`build_changes_docx` output to ``base_dir / name``."""
 
     path = base_dir / name
+    path.write_bytes(build_changes_docx())
+    return path
+
+
+@lru_cache(maxsize=None)
+def build_highlights_docx() -> bytes:
+    """Return the bytes of a DOCX package containing highlighted text across stories."""
 
     document_body = textwrap.dedent(
         f"""
@@ -824,14 +962,25 @@ def create_highlights_docx(base_dir: Path, name: str) -> Path:
         """
     ).strip()
 
-    with zipfile.ZipFile(path, "w") as zf:
-        zf.writestr("[Content_Types].xml", _content_types_for_changes())
-        zf.writestr("_rels/.rels", RELATIONSHIPS_WITH_DOCUMENT)
-        zf.writestr("word/document.xml", document_body)
-        zf.writestr("word/_rels/document.xml.rels", DOCUMENT_RELS_WITH_CHANGES)
-        zf.writestr("word/header1.xml", header_xml)
-        zf.writestr("word/footer1.xml", footer_xml)
-        zf.writestr("word/footnotes.xml", footnotes_xml)
-        zf.writestr("word/endnotes.xml", endnotes_xml)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(
+        buffer, "w", compression=FIXTURE_COMPRESSION, allowZip64=False
+    ) as zf:
+        zf.writestr(_entry("[Content_Types].xml"), CONTENT_TYPES_CHANGES)
+        zf.writestr(_entry("_rels/.rels"), RELATIONSHIPS_WITH_DOCUMENT)
+        zf.writestr(_entry("word/document.xml"), document_body)
+        zf.writestr(_entry("word/_rels/document.xml.rels"), DOCUMENT_RELS_WITH_CHANGES)
+        zf.writestr(_entry("word/header1.xml"), header_xml)
+        zf.writestr(_entry("word/footer1.xml"), footer_xml)
+        zf.writestr(_entry("word/footnotes.xml"), footnotes_xml)
+        zf.writestr(_entry("word/endnotes.xml"), endnotes_xml)
 
+    return buffer.getvalue()
+
+
+def create_highlights_docx(base_dir: Path, name: str) -> Path:
+    """Write :func:`build_highlights_docx` output to ``base_dir / name``."""
+
+    path = base_dir / name
+    path.write_bytes(build_highlights_docx())
     return path
@@ -24,8 +24,8 @@ def test_audit_wraps_tool_outputs(tmp_path):
     payload = json.loads(result.output)
 
     assert payload["tool"] == "lawdocx-audit"
-    tool_names = [entry["tool"] for entry in payload["tools"]]
-    for expected in [
+    tool_names = {entry["tool"] for entry in payload["tools"]}
+    assert {
         "lawdocx-metadata",
         "lawdocx-boilerplate",
         "lawdocx-todos",
@@ -35,8 +35,7 @@ def test_audit_wraps_tool_outputs(tmp_path):
         "lawdocx-highlights",
         "lawdocx-brackets",
         "lawdocx-outline",
-    ]:
-        assert expected in tool_names
+    } <= tool_names
 
 
 def test_audit_can_filter_tools(tmp_path):
@@ -76,3 +76,24 @@ def test_metadata_outputs_single_merged_envelope(tmp_path):
         any(item["details"]["category"] == "custom-xml" for item in entry["items"])
         for entry in payload["files"]
     )
+
+
+def test_metadata_jobs_option_matches_serial_output(tmp_path):
+    runner = CliRunner()
+    file_one = create_metadata_docx(tmp_path, "one.docx", include_custom=True)
+    file_two = create_metadata_docx(tmp_path, "two.docx", include_custom=False)
+    args = ["metadata", str(file_one), str(file_two)]
+
+    serial = runner.invoke(main, args)
+    parallel = runner.invoke(main, [*args, "--jobs", "2"])
+
+    assert serial.exit_code == 0
+    assert parallel.exit_code == 0
+
+    def _summary(output):
+        return [
+            (entry["path"], [item["details"]["name"] for item in entry["items"]])
+            for entry in json.loads(output)["files"]
+        ]
+
+    assert _summary(parallel.output) == _summary(serial.output)
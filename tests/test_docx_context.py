@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from lawdocx.docx_context import DocxContext
+from lawdocx.metadata import collect_metadata
+from lawdocx.outline import collect_outline
+from lawdocx.todos import collect_todos
+from tests.docx_factory import create_boilerplate_docx, create_metadata_docx
+
+
+def _without_ids(findings):
+    return [{k: v for k, v in f.as_dict().items() if k != "id"} for f in findings]
+
+
+class _CountingReader(io.BytesIO):
+    """BytesIO that counts the reads made through it."""
+
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.reads = 0
+
+    def read(self, *args):
+        self.reads += 1
+        return super().read(*args)
+
+
+def test_context_serves_several_collectors(tmp_path):
+    path = create_boilerplate_docx(
+        tmp_path,
+        "shared.docx",
+        header_text="TODO header",
+        body_paragraphs=["1. Manual numbering", "Body needs CHECK"],
+    )
+
+    with DocxContext(str(path)) as package:
+        todos = collect_todos(package)
+        outline = collect_outline(package)
+
+    assert _without_ids(todos) == _without_ids(collect_todos(str(path)))
+    assert _without_ids(outline) == _without_ids(collect_outline(str(path)))
+    assert {item["details"]["matched_pattern"] for item in _without_ids(todos)} == {
+        "TODO",
+        "CHECK",
+    }
+
+
+def test_context_caches_parts_and_reports_missing(tmp_path):
+    path = create_metadata_docx(tmp_path, "cached.docx")
+    handle = _CountingReader(path.read_bytes())
+
+    with DocxContext(handle) as package:
+        first = package.read("docProps/core.xml")
+        reads = handle.reads
+        assert package.read("docProps/core.xml") == first
+        assert handle.reads == reads
+        assert "docProps/core.xml" in package
+        assert "word/styles.xml" not in package
+        with pytest.raises(KeyError):
+            package.read("word/styles.xml")
+        assert collect_metadata(package)
+
+
+def test_prefetch_reads_existing_parts_only(tmp_path):
+    path = create_metadata_docx(tmp_path, "prefetch.docx", include_custom=False)
+    handle = _CountingReader(path.read_bytes())
+
+    with DocxContext(handle) as package:
+        package.prefetch(["docProps/core.xml", "docProps/custom.xml"])
+        reads = handle.reads
+        assert package.read("docProps/core.xml")
+        assert handle.reads == reads
+        assert "docProps/custom.xml" not in package
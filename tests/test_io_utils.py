@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+
+from lawdocx.io_utils import InputSource, iter_collector_targets, resolve_output_handle
+from lawdocx.utils import dump_json_line
+
+
+def test_resolve_output_handle_opens_binary_mode(tmp_path):
+    target = tmp_path / "out.json"
+
+    handle, should_close = resolve_output_handle(str(target), mode="wb")
+    try:
+        dump_json_line({"path": "café.docx"}, handle)
+    finally:
+        handle.close()
+
+    assert should_close
+    assert json.loads(target.read_bytes().decode("utf-8")) == {"path": "café.docx"}
+
+
+def test_resolve_output_handle_writes_text_as_utf8(tmp_path):
+    target = tmp_path / "out.json"
+
+    handle, _ = resolve_output_handle(str(target))
+    with handle:
+        handle.write("café\n")
+
+    assert target.read_bytes() == "café\n".encode("utf-8")
+
+
+def test_iter_collector_targets_streams_files_and_buffers_memory(tmp_path):
+    path = tmp_path / "input.docx"
+    path.write_bytes(b"on disk")
+    sources = [
+        InputSource(path=str(path), handle=open(path, "rb")),
+        InputSource(path="virtual.docx", handle=io.BytesIO(b"in memory")),
+    ]
+
+    try:
+        results = list(iter_collector_targets(sources))
+    finally:
+        sources[0].handle.close()
+
+    (_, disk_hash, disk_target), (_, memory_hash, memory_target) = results
+    assert disk_hash == hashlib.sha256(b"on disk").hexdigest()
+    assert disk_target == str(path)
+    assert memory_hash == hashlib.sha256(b"in memory").hexdigest()
+    assert memory_target.read() == b"in memory"
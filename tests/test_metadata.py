@@ -2,12 +2,13 @@
 from __future__ import annotations
 
 from hashlib import sha256
+import io
 import json
 
 from lawdocx.metadata import collect_metadata, run_metadata
 from lawdocx import __version__
 from lawdocx.io_utils import InputSource
-from tests.docx_factory import create_metadata_docx
+from tests.docx_factory import build_metadata_docx, create_metadata_docx
 
 
 def _as_dicts(findings):
@@ -55,6 +56,16 @@ def test_collect_metadata_gracefully_handles_missing_custom_props(tmp_path):
     assert all(f["severity"] == "info" for f in findings)
 
 
+def test_collect_metadata_reads_binary_stream(tmp_path):
+    path = create_metadata_docx(tmp_path, "metadata_stream.docx")
+    data = build_metadata_docx()
+
+    from_stream = _as_dicts(collect_metadata(io.BytesIO(data)))
+    from_path = _as_dicts(collect_metadata(str(path)))
+
+    assert [f["details"] for f in from_stream] == [f["details"] for f in from_path]
+
+
 def test_run_metadata_emits_schema_envelope_and_hash(tmp_path):
     path = create_metadata_docx(tmp_path, "metadata_sample.docx", include_custom=True)
     inputs = [InputSource(path=str(path), handle=open(path, "rb"))]
@@ -77,3 +88,67 @@ def test_run_metadata_emits_schema_envelope_and_hash(tmp_path):
     assert file_entry["sha256"] == expected_hash
     assert any(item["details"]["category"] == "core" for item in file_entry["items"])
     assert any(item["details"]["category"] == "custom" for item in file_entry["items"])
+
+
+def test_run_metadata_keeps_input_order_for_batches(tmp_path):
+    paths = [
+        create_metadata_docx(tmp_path, "first.docx", include_custom=True),
+        create_metadata_docx(tmp_path, "second.docx", include_custom=False),
+        create_metadata_docx(tmp_path, "third.docx", include_custom=True),
+    ]
+    inputs = [InputSource(path=str(path), handle=open(path, "rb")) for path in paths]
+    try:
+        payload = run_metadata(inputs, workers=2)
+    finally:
+        for source in inputs:
+            source.handle.close()
+
+    assert [entry["path"] for entry in payload["files"]] == [str(path) for path in paths]
+    assert [entry["sha256"] for entry in payload["files"]] == [
+        sha256(path.read_bytes()).hexdigest() for path in paths
+    ]
+    custom_flags = [
+        any(item["details"]["category"] == "custom" for item in entry["items"])
+        for entry in payload["files"]
+    ]
+    assert custom_flags == [True, False, True]
+    ids = [item["id"] for entry in payload["files"] for item in entry["items"]]
+    assert len(ids) == len(set(ids))
+
+
+def test_metadata_findings_do_not_share_location_or_context(tmp_path):
+    path = create_metadata_docx(tmp_path, "shared.docx")
+    first, second = collect_metadata(str(path))[:2]
+
+    first.as_dict()["location"]["story"] = "mutated"
+    first.as_dict()["context"]["before"] = "mutated"
+
+    assert second.location["story"] == "metadata"
+    assert second.context["before"] == ""
+
+
+def test_run_metadata_hashes_in_memory_handle_without_file():
+    data = build_metadata_docx()
+    source = InputSource(path="virtual.docx", handle=io.BytesIO(data))
+
+    payload = run_metadata([source])
+
+    file_entry = payload["files"][0]
+    assert file_entry["sha256"] == sha256(data).hexdigest()
+    assert {item["details"]["category"] for item in file_entry["items"]} >= {"core", "custom"}
+
+
+def test_run_metadata_reports_error_when_path_disappears(tmp_path):
+    path = create_metadata_docx(tmp_path, "vanishing.docx")
+    data = path.read_bytes()
+    handle = open(path, "rb")
+    path.unlink()
+
+    try:
+        payload = run_metadata([InputSource(path=str(path), handle=handle)])
+    finally:
+        handle.close()
+
+    file_entry = payload["files"][0]
+    assert file_entry["sha256"] == sha256(data).hexdigest()
+    assert [item["severity"] for item in file_entry["items"]] == ["error"]
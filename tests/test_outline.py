@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 
 from lawdocx.io_utils import InputSource
-from lawdocx.outline import collect_outline, run_outline
+from lawdocx.outline import _has_manual_numbering, collect_outline, run_outline
 from tests.docx_factory import create_outline_docx
 
 
@@ -40,3 +40,9 @@ def test_run_outline_emits_envelope_and_hash(tmp_path):
     assert file_entry["path"] == str(path)
     assert file_entry["sha256"]
     assert any(item["details"].get("category") for item in file_entry["items"])
+
+
+def test_manual_numbering_prefilter_accepts_unicode_digits():
+    assert _has_manual_numbering("١. Definitions")
+    assert _has_manual_numbering("  ２) Term")
+    assert not _has_manual_numbering("Definitions")
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import hashlib
+import io
 import json
 
 from lawdocx.io_utils import InputSource
 from lawdocx.todos import collect_todos, run_todos
-from tests.docx_factory import create_boilerplate_docx
+from tests.docx_factory import (
+    build_boilerplate_docx,
+    create_boilerplate_docx,
+    create_run_breaks_docx,
+)
 
 
 def _as_dicts(findings):
@@ -63,3 +69,74 @@ def test_run_todos_emits_envelope_and_hash(tmp_path):
     assert file_entry["path"] == str(path)
     assert file_entry["sha256"]
     assert any(item["type"] == "todo" for item in file_entry["items"])
+
+
+def test_collect_todos_reports_overlapping_markers_once(tmp_path):
+    path = create_boilerplate_docx(
+        tmp_path,
+        "overlap.docx",
+        body_paragraphs=["Fee is [TBD] pending review"],
+    )
+
+    findings = _as_dicts(collect_todos(str(path)))
+
+    assert [item["details"]["matched_pattern"] for item in findings] == ["[TBD]"]
+
+
+def test_run_todos_reads_stdin_without_temp_file(tmp_path):
+    path = create_boilerplate_docx(tmp_path, "stdin.docx", header_text="TODO header")
+    data = path.read_bytes()
+    source = InputSource(path="-", handle=io.BytesIO(data), is_stdin=True)
+
+    payload = run_todos([source])
+
+    file_entry = payload["files"][0]
+    assert file_entry["path"] == "stdin"
+    assert file_entry["sha256"] == hashlib.sha256(data).hexdigest()
+    assert [item["details"]["matched_pattern"] for item in file_entry["items"]] == ["TODO"]
+
+
+def test_collect_todos_reads_binary_stream():
+    data = build_boilerplate_docx(header_text="TODO header")
+
+    findings = _as_dicts(collect_todos(io.BytesIO(data)))
+
+    assert [item["details"]["matched_pattern"] for item in findings] == ["TODO"]
+
+
+def test_collect_todos_reads_deflated_body(tmp_path):
+    paragraphs = [f"Filler paragraph {index}" for index in range(200)] + ["TODO last"]
+    path = create_boilerplate_docx(tmp_path, "large.docx", body_paragraphs=paragraphs)
+
+    findings = _as_dicts(collect_todos(str(path)))
+
+    assert [item["location"]["paragraph_index_start"] for item in findings] == [200]
+
+
+def test_collect_todos_treats_tabs_and_breaks_as_whitespace(tmp_path):
+    path = create_run_breaks_docx(tmp_path, "breaks.docx")
+
+    findings = _as_dicts(collect_todos(str(path)))
+
+    matched = [item["details"]["matched_pattern"] for item in findings]
+    assert matched == ["TODO", "TBD", "CHECK"]
+    assert findings[0]["context"]["after"].startswith("\tafter tab")
+    assert findings[1]["context"]["before"].endswith("First line\n")
+
+
+def test_collect_todos_custom_pattern_with_inline_flags(tmp_path):
+    path = create_boilerplate_docx(
+        tmp_path, "flags.docx", body_paragraphs=["remember the todo list"]
+    )
+
+    findings = _as_dicts(collect_todos(str(path), patterns=[r"(?i)TODO", r"list"]))
+
+    assert [item["details"]["matched_pattern"] for item in findings] == ["todo", "list"]
+
+
+def test_collect_todos_custom_patterns_keep_their_own_groups(tmp_path):
+    path = create_boilerplate_docx(tmp_path, "groups.docx", body_paragraphs=["xx aa bb yy"])
+
+    findings = _as_dicts(collect_todos(str(path), patterns=[r"(a)\1", r"(b)\1"]))
+
+    assert [item["details"]["matched_pattern"] for item in findings] == ["aa", "bb"]
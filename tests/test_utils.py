@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+
+from lawdocx import utils
+
+
+def test_dump_json_line_writes_one_compact_line():
+    handle = io.StringIO()
+    payload = {"tool": "lawdocx-test", "files": [{"path": "café.docx", "items": []}]}
+
+    utils.dump_json_line(payload, handle)
+
+    text = handle.getvalue()
+    assert text.endswith("\n") and text.count("\n") == 1
+    assert json.loads(text) == payload
+
+    binary = io.BytesIO()
+    utils.dump_json_line(payload, binary)
+    assert binary.getvalue() == text.encode()
+
+
+def test_dump_json_line_falls_back_to_stdlib(monkeypatch):
+    monkeypatch.setattr(utils, "orjson", None)
+    handle = io.StringIO()
+    payload = {"tool": "lawdocx-test", "files": [{"path": "café.docx", "items": []}]}
+
+    utils.dump_json_line(payload, handle)
+
+    expected = json.dumps(payload)
+    assert handle.getvalue() == expected + "\n"
+
+    binary = io.BytesIO()
+    utils.dump_json_line(payload, binary)
+    assert binary.getvalue() == (expected + "\n").encode()
+
+
+def test_dump_json_line_writes_utf8_bytes_under_text_wrappers():
+    raw = io.BytesIO()
+    handle = io.TextIOWrapper(raw, encoding="ascii")
+    handle.write("prefix\n")
+    payload = {"path": "café.docx"}
+
+    utils.dump_json_line(payload, handle)
+    handle.flush()
+
+    first, second = raw.getvalue().split(b"\n", 1)
+    assert first == b"prefix"
+    assert json.loads(second.decode("utf-8")) == payload
+
+
+def test_hash_file_matches_hashlib_on_both_sides_of_mmap_threshold(tmp_path):
+    small = tmp_path / "small.bin"
+    large = tmp_path / "large.bin"
+    small.write_bytes(b"lawdocx" * 10)
+    large.write_bytes(b"\x00\x01lawdocx" * (utils.MMAP_THRESHOLD // 9 + 1))
+
+    for path in (small, large):
+        assert utils.hash_file(str(path)) == hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def test_hash_stream_matches_hashlib_for_files_and_buffers(tmp_path):
+    data = os.urandom(4096)
+    path = tmp_path / "stream.bin"
+    path.write_bytes(data)
+    expected = hashlib.sha256(data).hexdigest()
+
+    with open(path, "rb") as handle:
+        assert utils.hash_stream(handle) == expected
+    assert utils.hash_stream(io.BytesIO(data), chunk_size=1000) == expected
+
+
+def test_filter_files_by_severity_thresholds():
+    files = [
+        {
+            "path": "a.docx",
+            "items": [
+                {"severity": "info"},
+                {"severity": "warning"},
+                {"severity": "error"},
+                {"severity": "custom"},
+            ],
+        }
+    ]
+
+    def severities(minimum):
+        filtered = utils.filter_files_by_severity(files, minimum)
+        return [item["severity"] for item in filtered[0]["items"]]
+
+    assert severities("info") == ["info", "warning", "error", "custom"]
+    assert severities("warning") == ["warning", "error"]
+    assert severities("error") == ["error"]
+    assert len(files[0]["items"]) == 4
+
+
+def test_filter_and_summarize_matches_separate_passes():
+    files = [
+        {"path": "a.docx", "items": [{"severity": "info"}, {"severity": "error"}]},
+        {"path": "b.docx", "items": [{"severity": "warning"}, {"severity": "custom"}]},
+    ]
+    expected = {
+        "info": [["info", "error"], ["warning", "custom"]],
+        "warning": [["error"], ["warning"]],
+        "error": [["error"], []],
+    }
+
+    for minimum, severities in expected.items():
+        filtered, totals = utils.filter_and_summarize(files, minimum)
+        assert [[item["severity"] for item in entry["items"]] for entry in filtered] == severities
+        assert totals == utils.summarize_severities(filtered)
+
+
+def _pid(_):
+    return os.getpid()
+
+
+def test_map_inputs_runs_in_process_by_default():
+    assert utils.map_inputs(_pid, [(1,), (2,), (3,)]) == [os.getpid()] * 3
+
+
+def test_map_inputs_falls_back_when_pool_cannot_start(monkeypatch):
+    def refuse(*args, **kwargs):
+        raise AssertionError("daemonic processes are not allowed to have children")
+
+    monkeypatch.setattr(utils, "ProcessPoolExecutor", refuse)
+
+    assert utils.map_inputs(str, [(1,), (2,)], workers=2) == ["1", "2"]
+
+
+def test_build_envelope_copies_files_list():
+    files = [{"path": "a.docx", "items": []}]
+
+    envelope = utils.build_envelope(tool="lawdocx-test", files=files)
+    files.append({"path": "b.docx", "items": []})
+
+    assert [entry["path"] for entry in envelope["files"]] == ["a.docx"]
+
+
+def test_hash_stream_reads_pipes_in_full_chunks():
+    data = os.urandom(70_000)
+    read_fd, write_fd = os.pipe()
+
+    class _Counting(io.FileIO):
+        reads = 0
+
+        def readinto(self, buffer):
+            _Counting.reads += 1
+            return super().readinto(buffer)
+
+    with _Counting(read_fd, "rb") as handle:
+        os.write(write_fd, data)
+        os.close(write_fd)
+        assert utils.hash_stream(handle) == hashlib.sha256(data).hexdigest()
+
+    assert _Counting.reads < 100